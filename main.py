@@ -4,22 +4,13 @@ import sys
 from pathlib import Path
 import yaml
 import click
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import WebDriverException
-from lib_resume_builder_AIHawk import Resume, StyleManager, FacadeManager, ResumeGenerator
-from src.utils import chromeBrowserOptions
-from src.gpt import GPTAnswerer
-from src.linkedIn_authenticator import LinkedInAuthenticator
-from src.linkedIn_bot_facade import LinkedInBotFacade
-from src.linkedIn_job_manager import LinkedInJobManager
-from src.job_application_profile import JobApplicationProfile
+import src.startup_profile as startup_profile
+from src.run_config import ConfigError, RunConfig
 
-sys.stderr = open(os.devnull, 'w')  # Suppress stderr logs
+# selenium, langchain and the resume builder take seconds to import: they are imported in
+# create_and_run_bot, once the data folder and config files have been validated
 
-class ConfigError(Exception):
-    pass
+sys.stderr = open(os.devnull, 'w')  # Suppress stderr logs
 
 class ConfigValidator:
     @staticmethod
@@ -84,55 +75,103 @@ class FileManager:
 
         return result
 
-def init_browser() -> webdriver.Chrome:
-    try:
-        print("🌍 Setting up Chrome browser...")
-        options = chromeBrowserOptions()
-        service = ChromeService(ChromeDriverManager().install())
-        browser = webdriver.Chrome(service=service, options=options)
-        print("✅ Chrome browser initialized successfully.")
-        return browser
-    except WebDriverException as e:
-        print("❌ Error: WebDriver failed to initialize. LinkedIn may be blocking automation.")
-        raise RuntimeError(f"Failed to initialize browser: {str(e)}")
+def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_key: str, plain_text_resume_file: Path,
+                       run_config: RunConfig):
+    from selenium.common.exceptions import WebDriverException
 
-def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_key: str, plain_text_resume_file: Path):
     try:
         print("🔍 Initializing Resume Generation Components...")
-        style_manager = StyleManager()
-        resume_generator = ResumeGenerator()
-        
-        # ✅ Use the correctly passed plain_text_resume_file
-        with open(plain_text_resume_file, "r", encoding="utf-8") as f:
-            yaml_data = f.read()
+        with startup_profile.phase("resume load"):
+            from lib_resume_builder_AIHawk import Resume, StyleManager, FacadeManager, ResumeGenerator
+            from src.resume_cache import ResumeCache, TailoredResumeCache
+            from src.resume_yaml import ParsedResume
+
+            style_manager = StyleManager()
+            resume_generator = ResumeGenerator()
 
-        resume_object = Resume(yaml_data)
+            # ✅ Parsed once for the job application profile and the fit scorer, which share the tree.
+            # The resume builder's Resume only takes the text and parses it again itself.
+            parsed_resume = ParsedResume.load(plain_text_resume_file)
+            yaml_data = parsed_resume.text
+            resume_object = Resume(yaml_data)
 
         print("✅ Resume loaded successfully.")
 
-        resume_generator_manager = FacadeManager(openai_api_key, style_manager, resume_generator, resume_object, Path("data_folder/output"))
-        pdf_base64_data = resume_generator_manager.pdf_base64()
+        with startup_profile.phase("PDF generation"):
+            resume_generator_manager = FacadeManager(openai_api_key, style_manager, resume_generator, resume_object, Path("data_folder/output"))
+            pdf_base64_data = ResumeCache.from_parameters(parameters).base_pdf_base64(yaml_data, resume_generator_manager)
         print("📄 PDF Resume Generated Successfully.")
 
-        print("🌐 Initializing Browser...")
-        browser = init_browser()
-        login_component = LinkedInAuthenticator(browser)
-        gpt_answerer_component = GPTAnswerer(openai_api_key)  # ✅ Use API key from secrets.yaml
-        job_application_profile_object = JobApplicationProfile(yaml_data)  # ✅ Create job profile
-        apply_component = LinkedInJobManager(browser, gpt_answerer_component, job_application_profile_object, resume_generator_manager)
-
-        print("🤖 Setting up LinkedIn Bot...")
-        bot = LinkedInBotFacade(login_component, apply_component)
-        bot.set_secrets(email, password)
-        bot.set_job_application_profile_and_resume(job_application_profile_object, resume_object)
-        bot.set_gpt_answerer_and_resume_generator(gpt_answerer_component, resume_generator_manager)
-        bot.set_parameters(parameters)
-        
-        print("🔑 Logging into LinkedIn...")
-        bot.start_login()
-
-        print("📩 Starting job applications...")
-        bot.start_apply()
+        with startup_profile.phase("bot components"):
+            from src.gpt import GPTAnswerer
+            from src.llm_rate_limiter import RateLimiter
+            from src.linkedIn_authenticator import LinkedInAuthenticator
+            from src.linkedIn_bot_facade import LinkedInBotFacade
+            from src.linkedIn_job_manager import LinkedInJobManager
+            from src.job_application_profile import JobApplicationProfile
+            from src.search_scheduler import SearchScheduler
+
+            gpt_answerer_component = GPTAnswerer(openai_api_key, rate_limiter=RateLimiter.from_parameters(parameters))  # ✅ Use API key from secrets.yaml
+            job_application_profile_object = JobApplicationProfile(parsed_resume.data)  # ✅ Create job profile
+        browser_parameters = parameters.get('browser') or {}
+        capture_network = bool((parameters.get('network') or {}).get('enabled', False))
+
+        def build_bot(browser) -> LinkedInBotFacade:
+            login_component = LinkedInAuthenticator.from_parameters(browser, parameters)
+            apply_component = LinkedInJobManager(browser, gpt_answerer_component, job_application_profile_object, resume_generator_manager)
+
+            print("🤖 Setting up LinkedIn Bot...")
+            bot = LinkedInBotFacade(login_component, apply_component)
+            bot.set_secrets(email, password)
+            bot.set_job_application_profile_and_resume(job_application_profile_object, resume_object)
+            bot.set_gpt_answerer_and_resume_generator(gpt_answerer_component, resume_generator_manager)
+            bot.set_parameters(parameters)
+
+            print("🔑 Logging into LinkedIn...")
+            with startup_profile.phase("login"):
+                bot.start_login()
+            startup_profile.report_once()
+            return bot
+
+        workers = int(parameters.get('workers', 1) or 1)
+        searches = SearchScheduler.from_parameters(parameters).order(run_config.searches)
+        pipeline_parameters = parameters.get('pipeline') or {}
+        if pipeline_parameters.get('enabled', False):
+            print("🌐 Initializing Discovery → Apply Pipeline...")
+            from src.job_queue import JobQueue
+            from src.job_pipeline import JobPipeline
+            from src.document_pregenerator import DocumentPregenerator
+
+            job_queue = JobQueue(Path(parameters['outputFileDirectory']) / "job_queue.db",
+                                 max_pending=pipeline_parameters.get('max_pending', 50))
+            pregenerator = DocumentPregenerator.from_parameters(
+                parameters, openai_api_key, parsed_resume, TailoredResumeCache.from_parameters(parameters, resume_generator_manager)
+            )
+            pipeline = JobPipeline(job_queue, lambda browser: build_bot(browser).apply_component,
+                                   discovery_workers=pipeline_parameters.get('discovery_workers', 1),
+                                   apply_workers=pipeline_parameters.get('apply_workers', 1),
+                                   headless=browser_parameters.get('headless', False), capture_network=capture_network,
+                                   pregenerator=pregenerator)
+            print("📩 Starting job applications...")
+            pipeline.run(searches)
+        elif workers > 1:
+            print(f"🌐 Initializing {workers} Browser Workers...")
+            from src.worker_pool import BrowserWorkerPool
+
+            pool = BrowserWorkerPool(workers, lambda browser: build_bot(browser).apply_component,
+                                     headless=browser_parameters.get('headless', False), capture_network=capture_network)
+            print("📩 Starting job applications...")
+            pool.run(searches)
+        else:
+            print("🌐 Initializing Browser...")
+            with startup_profile.phase("browser"):
+                from src.browser_bootstrap import init_browser
+
+                browser = init_browser(headless=browser_parameters.get('headless', False), capture_network=capture_network)
+            bot = build_bot(browser)
+
+            print("📩 Starting job applications...")
+            bot.start_apply()
 
         print("🎉 Job application process completed successfully!")
     except WebDriverException as e:
@@ -142,21 +181,26 @@ def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_k
 
 @click.command()
 @click.option('--resume', type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path), help="Path to the resume PDF file")
-def main(resume: Path = None):
+@click.option('--startup-profile', 'profile_startup', is_flag=True, help="Print how long each startup phase and import took")
+def main(resume: Path = None, profile_startup: bool = False):
+    if profile_startup:
+        startup_profile.enable()
     try:
         print("📂 Validating data folder and files...")
-        data_folder = Path("data_folder")
-        secrets_file, config_file, plain_text_resume_file, output_folder = FileManager.validate_data_folder(data_folder)
-        
-        print("✅ Loading configuration files...")
-        parameters = ConfigValidator.validate_yaml_file(config_file)
-        email, password, openai_api_key = ConfigValidator.validate_secrets(secrets_file)
-        
-        parameters['uploads'] = FileManager.file_paths_to_dict(resume, plain_text_resume_file)
-        parameters['outputFileDirectory'] = output_folder
+        with startup_profile.phase("validation"):
+            data_folder = Path("data_folder")
+            secrets_file, config_file, plain_text_resume_file, output_folder = FileManager.validate_data_folder(data_folder)
+
+            print("✅ Loading configuration files...")
+            parameters = ConfigValidator.validate_yaml_file(config_file)
+            email, password, openai_api_key = ConfigValidator.validate_secrets(secrets_file)
+
+            parameters['uploads'] = FileManager.file_paths_to_dict(resume, plain_text_resume_file)
+            parameters['outputFileDirectory'] = output_folder
+            run_config = RunConfig.compile(parameters)
         
         print("🚀 Launching job application bot...")
-        create_and_run_bot(email, password, parameters, openai_api_key, plain_text_resume_file)  # ✅ Pass it explicitly
+        create_and_run_bot(email, password, parameters, openai_api_key, plain_text_resume_file, run_config)  # ✅ Pass it explicitly
 
     except Exception as e:
         print(f"❌ Error: {e}")
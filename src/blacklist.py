@@ -0,0 +1,139 @@
+import re
+import unicodedata
+from collections import deque
+from src.run_config import ConfigError
+
+
+def normalize(text: str) -> str:
+    """Lowercase, accents folded and whitespace collapsed, so "Café  Noir" and "cafe noir" compare equal."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.lower().split())
+
+
+class BlacklistMatcher:
+    """Matches text against many blacklist entries in a single pass.
+
+    Entries are compiled once:
+      - `Noir` matches the whole word(s) anywhere in the text ("Senior Noir Engineer", not "Noirette")
+      - `contains:noir` matches as a substring ("Noirette" too)
+      - `regex:^senior .* manager$` is a case-insensitive regular expression on the normalized text
+    Literal entries are matched together by an Aho-Corasick automaton, so the cost depends on
+    the length of the text, not on the number of entries; regexes are joined into one pattern.
+    """
+
+    def __init__(self, entries):
+        self.entries = [str(entry) for entry in entries or [] if entry is not None and str(entry).strip()]
+        self._patterns = []  # (normalized literal, whole word only, original entry)
+        regexes = []
+        for entry in self.entries:
+            if entry.startswith("regex:"):
+                regexes.append((entry, entry[len("regex:"):].strip()))
+            elif entry.startswith("contains:"):
+                self._patterns.append((normalize(entry[len("contains:"):]), False, entry))
+            else:
+                self._patterns.append((normalize(entry), True, entry))
+        self._patterns = [pattern for pattern in self._patterns if pattern[0]]
+        self._regex_entries = [entry for entry, _ in regexes]
+        self._regex = self._compile_regexes(regexes) if regexes else None
+        self._build_automaton()
+
+    @staticmethod
+    def _compile_regexes(regexes):
+        """One pattern with a named group per entry; raises ConfigError naming an invalid entry."""
+        for entry, regex in regexes:
+            try:
+                re.compile(regex, re.IGNORECASE)
+            except re.error as e:
+                raise ConfigError(f"❌ Invalid blacklist entry '{entry}': {e}") from e
+        # the generated names cannot clash with the groups of an entry
+        joined = "|".join(f"(?P<_blacklist_{index}>(?:{regex}))" for index, (_, regex) in enumerate(regexes))
+        try:
+            return re.compile(joined, re.IGNORECASE)
+        except re.error as e:  # e.g. inline flags or numbered back references, valid only on their own
+            raise ConfigError(f"❌ Invalid blacklist entries {', '.join(repr(entry) for entry, _ in regexes)}: {e}") from e
+
+    def __bool__(self) -> bool:
+        return bool(self.entries)
+
+    def _build_automaton(self) -> None:
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for index, (literal, _, _) in enumerate(self._patterns):
+            state = 0
+            for char in literal:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append(index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _matches(self, text: str):
+        """Yields the entries matching `text` as they are found, regexes last."""
+        text = normalize(text)
+        if not text:
+            return
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._output[state]:
+                literal, whole_word, entry = self._patterns[index]
+                start = end - len(literal) + 1
+                if not whole_word or (
+                    (start == 0 or not text[start - 1].isalnum()) and (end + 1 == len(text) or not text[end + 1].isalnum())
+                ):
+                    yield entry
+        if self._regex:
+            for found in self._regex.finditer(text):
+                yield self._regex_entries[int(found.lastgroup.rpartition("_")[2])]
+
+    def match(self, text: str):
+        """Returns the first entry matching `text`, or None."""
+        return next(self._matches(text), None)
+
+    def find_all(self, text: str) -> set:
+        """All entries matching `text`."""
+        return set(self._matches(text))
+
+
+class JobBlacklists:
+    """Company, title and location blacklists of config.yaml, compiled once per run."""
+
+    def __init__(self, company_entries, title_entries, location_entries):
+        self.company = BlacklistMatcher(company_entries)
+        self.title = BlacklistMatcher(title_entries)
+        self.location = BlacklistMatcher(location_entries)
+
+    @classmethod
+    def from_parameters(cls, parameters: dict):
+        # Both spellings are in use: companyBlacklist (example config) and company_blacklist
+        def entries(name: str, camel_case: str) -> list:
+            return (parameters.get(camel_case) or []) + (parameters.get(name) or [])
+
+        return cls(entries('company_blacklist', 'companyBlacklist'), entries('title_blacklist', 'titleBlacklist'),
+                   entries('location_blacklist', 'locationBlacklist'))
+
+    def reason(self, title: str, company: str, location: str = ""):
+        """Describes the first blacklist entry the job matches, or returns None."""
+        for field, matcher, value in (("company", self.company, company), ("title", self.title, title),
+                                      ("location", self.location, location)):
+            entry = matcher.match(value) if matcher else None
+            if entry is not None:
+                return f"{field} matches '{entry}'"
+        return None
@@ -0,0 +1,98 @@
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+from src.utils import chromeBrowserOptions, chromeProfilePath
+
+DRIVER_CACHE_FILE = os.path.join(os.getcwd(), "chrome_profile", "driver_cache.json")
+
+
+class DriverResolver:
+    """Resolves the chromedriver binary once and caches its path and version on disk.
+
+    Later launches reuse the cached binary without any network lookup; webdriver_manager is
+    only consulted on a cache miss, and a chromedriver on PATH is used when it is unreachable.
+    """
+
+    def __init__(self, cache_file: str = DRIVER_CACHE_FILE):
+        self.cache_file = cache_file
+
+    def resolve(self, refresh: bool = False) -> str:
+        cached = None if refresh else self._read_cache()
+        if cached and os.path.exists(cached.get("path", "")):
+            return cached["path"]
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+        except Exception as e:
+            path = shutil.which("chromedriver")
+            if not path:
+                raise RuntimeError(f"Could not resolve chromedriver (offline and none on PATH): {e}")
+            print(f"⚠️ webdriver_manager unavailable, using chromedriver from PATH: {path}")
+
+        self._write_cache(path, self._driver_version(path))
+        return path
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_cache(self, path: str, version: str) -> None:
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"path": path, "version": version, "resolved_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f, indent=4)
+
+    @staticmethod
+    def _driver_version(path: str) -> str:
+        try:
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+            return output.split()[1] if output else ""
+        except Exception:
+            return ""
+
+
+def init_browser(headless: bool = False, profile_path: str = chromeProfilePath, capture_network: bool = False,
+                 resolver: DriverResolver = None) -> webdriver.Chrome:
+    """Starts Chrome with a cached driver and reports how long the startup took."""
+    resolver = resolver or DriverResolver()
+    try:
+        print("🌍 Setting up Chrome browser...")
+        started = time.perf_counter()
+        options = chromeBrowserOptions(capture_network=capture_network, headless=headless, profile_path=profile_path)
+        try:
+            browser = webdriver.Chrome(service=ChromeService(resolver.resolve()), options=options)
+        except SessionNotCreatedException:
+            # The cached driver no longer matches the installed Chrome: resolve it again once.
+            print("⚠️ Cached chromedriver does not match Chrome, resolving it again...")
+            browser = webdriver.Chrome(service=ChromeService(resolver.resolve(refresh=True)), options=options)
+        print(f"✅ Chrome browser initialized successfully in {time.perf_counter() - started:.1f}s.")
+        return browser
+    except WebDriverException as e:
+        print("❌ Error: WebDriver failed to initialize. LinkedIn may be blocking automation.")
+        raise RuntimeError(f"Failed to initialize browser: {str(e)}")
+
+
+def init_browsers(profile_paths: list, headless: bool = False, capture_network: bool = False) -> list:
+    """Starts one browser per profile directory in parallel. Profiles must be distinct, Chrome locks them."""
+    resolver = DriverResolver()
+    resolver.resolve()  # resolve once up front so the parallel starts only hit the cache
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(profile_paths) or 1) as executor:
+        futures = [executor.submit(init_browser, headless, profile_path, capture_network, resolver)
+                   for profile_path in profile_paths]
+    browsers = [future.result() for future in futures if future.exception() is None]
+    if len(browsers) < len(futures):
+        for browser in browsers:
+            browser.quit()
+        raise next(future.exception() for future in futures if future.exception() is not None)
+    print(f"✅ {len(browsers)} Chrome browsers initialized in {time.perf_counter() - started:.1f}s.")
+    return browsers
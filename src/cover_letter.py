@@ -0,0 +1,160 @@
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from xml.sax.saxutils import escape
+from src.json_store import locked_json
+
+
+class CoverLetterTemplate:
+    """Page layout and paragraph style of cover letter PDFs, built once and reused for every letter."""
+
+    def __init__(self, pagesize=None, margin: float = None, font_name: str = "Helvetica", font_size: int = 11):
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.units import inch
+
+        self.pagesize = pagesize or letter
+        self.margin = inch if margin is None else margin
+        self.paragraph_style = ParagraphStyle("CoverLetter", fontName=font_name, fontSize=font_size,
+                                              leading=font_size * 1.4, spaceAfter=font_size * 0.8)
+
+    def render(self, cover_letter: str, letter_path: str) -> str:
+        """Writes `cover_letter` to `letter_path`, wrapping lines to the page width and flowing onto new pages."""
+        from reportlab.platypus import Paragraph, SimpleDocTemplate
+
+        document = SimpleDocTemplate(str(letter_path), pagesize=self.pagesize, leftMargin=self.margin,
+                                     rightMargin=self.margin, topMargin=self.margin, bottomMargin=self.margin)
+        story = []
+        for paragraph in re.split(r"\n\s*\n", cover_letter.strip()):
+            story.append(Paragraph(escape(paragraph).replace("\n", "<br/>"), self.paragraph_style))
+        document.build(story)
+        return str(letter_path)
+
+
+_template = None
+
+
+def render_cover_letter_pdf(cover_letter: str, letter_path: str) -> str:
+    """Renders with the shared template, built (and reportlab imported) on the first letter. Module level so worker processes can run it."""
+    global _template
+    if _template is None:
+        _template = CoverLetterTemplate()
+    return _template.render(cover_letter, letter_path)
+
+
+class CoverLetterService:
+    """Cover letter text and PDFs, with the text cached per job and per company and title.
+
+    Letters are generated from the job description and resume, and kept in `texts.json` so a
+    job seen again, or another posting of the same role at the same company, reuses its
+    letter instead of paying for a new LLM call; pregeneration worker processes add to the same
+    file. PDFs go to the output folder's cover_letters/
+    directory, which keeps at most `max_files` of them (oldest deleted first).
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, gpt_answerer, directory: Path, max_files: int = 100):
+        self.gpt_answerer = gpt_answerer
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_files = max_files
+        self.texts_path = self.directory / "texts.json"
+        self.texts = self._load_texts()
+        self.generated = self.reused = self.rendered = 0
+        self.generation_seconds = self.render_seconds = 0.0
+        self._lock = threading.Lock()
+        # leftovers of interrupted renders; recent ones may belong to another process still rendering
+        for partial_path in self.directory.glob("*.part"):
+            if partial_path.stat().st_mtime < time.time() - 3600:
+                partial_path.unlink(missing_ok=True)
+
+    @classmethod
+    def from_parameters(cls, gpt_answerer, parameters: dict):
+        """Returns the service shared by every applier writing to the same output folder."""
+        options = parameters.get('cover_letters') or {}
+        directory = Path(parameters['outputFileDirectory']) / "cover_letters"
+        with cls._instances_lock:
+            if directory not in cls._instances:
+                cls._instances[directory] = cls(gpt_answerer, directory, max_files=options.get('max_files', 100))
+            return cls._instances[directory]
+
+    @staticmethod
+    def _company_key(job) -> str:
+        return "company:" + " ".join(re.findall(r"\w+", f"{job.company} {job.title}".lower()))
+
+    @staticmethod
+    def _cluster_key(job) -> str:
+        """Near-identical postings of the same company share a letter; other companies' letters name the wrong one."""
+        if not job.cluster_id:
+            return None
+        return f"cluster:{job.cluster_id}:" + " ".join(re.findall(r"\w+", job.company.lower()))
+
+    def text(self, job) -> str:
+        """Cover letter text for `job`, generated only when neither the job nor its company and title have one."""
+        job_key = f"job:{job.job_id}"
+        with self._lock:
+            cached = (self.texts.get(job_key) or self.texts.get(self._company_key(job))
+                      or self.texts.get(self._cluster_key(job)))
+            if cached:
+                self.reused += 1
+                self.texts[job_key] = cached
+                return cached
+
+        started = time.perf_counter()
+        cover_letter = self.gpt_answerer.generate_cover_letter(job)
+        with self._lock:
+            self.generated += 1
+            self.generation_seconds += time.perf_counter() - started
+            new_texts = {job_key: cover_letter, self._company_key(job): cover_letter}
+            if job.cluster_id:
+                new_texts[self._cluster_key(job)] = cover_letter
+            self._save_texts(new_texts)
+        return cover_letter
+
+    def pdf(self, job, cover_letter: str = None) -> str:
+        """Path of the rendered cover letter of `job`, rendering `cover_letter` (or its cached text) if needed."""
+        letter_path = self.directory / f"cover_letter_{job.job_id}.pdf"
+        if letter_path.exists():
+            return str(letter_path.resolve())
+        cover_letter = cover_letter or self.text(job)
+
+        started = time.perf_counter()
+        # render then rename, so the upload never sees a half-written file
+        partial_path = letter_path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.part")
+        render_cover_letter_pdf(cover_letter, str(partial_path))
+        partial_path.replace(letter_path)
+        with self._lock:
+            self.rendered += 1
+            self.render_seconds += time.perf_counter() - started
+            self._evict()
+        return str(letter_path.resolve())
+
+    def _evict(self) -> None:
+        letter_paths = sorted(self.directory.glob("cover_letter_*.pdf"), key=lambda path: path.stat().st_mtime)
+        for path in letter_paths[:max(0, len(letter_paths) - self.max_files)]:
+            path.unlink(missing_ok=True)
+
+    def report(self) -> str:
+        with self._lock:
+            generation = self.generation_seconds / self.generated if self.generated else 0.0
+            render = self.render_seconds / self.rendered if self.rendered else 0.0
+            return (f"Cover letters: {self.generated} generated ({generation:.1f}s avg), {self.reused} reused, "
+                    f"{self.rendered} rendered ({render * 1000:.0f}ms avg)")
+
+    def _load_texts(self) -> dict:
+        try:
+            with open(self.texts_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_texts(self, new_texts: dict) -> None:
+        """Adds `new_texts` to texts.json, picking up the letters other processes saved meanwhile."""
+        with locked_json(self.texts_path, indent=4) as texts:
+            texts.update(new_texts)
+        self.texts.update(texts)
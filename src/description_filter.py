@@ -0,0 +1,124 @@
+import re
+import threading
+from pathlib import Path
+from src.blacklist import BlacklistMatcher, normalize
+
+CLEARANCE_PHRASES = [
+    "security clearance", "secret clearance", "top secret", "ts/sci", "active clearance", "clearance required",
+    "polygraph", "dv clearance", "sc clearance",
+]
+NO_SPONSORSHIP_PHRASES = [
+    "no visa sponsorship", "no sponsorship", "unable to sponsor", "not able to sponsor", "cannot sponsor",
+    "will not sponsor", "does not sponsor", "without sponsorship", "without visa sponsorship",
+    "must be a us citizen", "must be a u.s. citizen", "us citizens only", "u.s. citizens only", "green card holders",
+]
+# "5+ years of experience", "3-5 yrs experience"; not "in business for 30 years"
+YEARS_REQUIRED_PATTERN = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years|yrs)\s+(?:of\s+)?(?:[a-z-]+\s+)?experience")
+
+
+class DescriptionFilter:
+    """Rejects fetched job descriptions by keyword rules before any LLM or form work.
+
+    All description phrases (required and forbidden keywords, clearance and no-sponsorship
+    phrases) are compiled into one BlacklistMatcher, so a description is scanned once whatever
+    the number of rules. Seniority markers are matched against the job title only: "Principal
+    Responsibilities" or "reports to the Director" in a description say nothing about the role.
+    Verdicts are kept per job ID, so a job checked during discovery is not counted twice when
+    it is applied to.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, required=None, forbidden=None, skip_clearance: bool = True, skip_no_sponsorship: bool = False,
+                 seniority_markers=None, max_years_required: int = None):
+        categories = {
+            "required": required or [],
+            "forbidden": forbidden or [],
+            "clearance": CLEARANCE_PHRASES if skip_clearance else [],
+            "no_sponsorship": NO_SPONSORSHIP_PHRASES if skip_no_sponsorship else [],
+        }
+        self.categories = {}  # entry -> categories it belongs to
+        for category, entries in categories.items():
+            for entry in entries:
+                self.categories.setdefault(str(entry), set()).add(category)
+        self.has_required = bool(categories["required"])
+        self.max_years_required = max_years_required
+        self.matcher = BlacklistMatcher(list(self.categories))
+        self.seniority_matcher = BlacklistMatcher(seniority_markers or [])
+        self.checked = self.rejected = 0
+        self.rejections = {}
+        self.keyword_hits = {}
+        self._verdicts = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict, disabled: bool = False):
+        """Returns the filter configured from the `description_filter` section of config.yaml, or None when disabled."""
+        options = parameters.get('description_filter') or {}
+        if disabled or not options.get('enabled', False):
+            return None
+        key = Path(parameters['outputFileDirectory'])  # shared by every job manager of the run
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(
+                    required=options.get('required'),
+                    forbidden=options.get('forbidden'),
+                    skip_clearance=options.get('skip_clearance', True),
+                    skip_no_sponsorship=options.get('skip_no_sponsorship', False),
+                    seniority_markers=options.get('seniority_markers'),
+                    max_years_required=options.get('max_years_required'),
+                )
+            return cls._instances[key]
+
+    def rejection_reason(self, job):
+        """Why the job is rejected on its title and description, or None when it passes."""
+        seniority = self.seniority_matcher.match(job.title) if self.seniority_matcher else None
+        if seniority is not None:
+            with self._lock:
+                self.keyword_hits[seniority] = self.keyword_hits.get(seniority, 0) + 1
+            return "seniority", f"has '{seniority}' in its title"
+        description = job.description
+        found = self.matcher.find_all(description)
+        with self._lock:
+            for entry in found:
+                self.keyword_hits[entry] = self.keyword_hits.get(entry, 0) + 1
+        matched = {}
+        for entry in sorted(found):
+            for category in self.categories[entry]:
+                matched.setdefault(category, entry)
+
+        for category in ("forbidden", "clearance", "no_sponsorship"):
+            if category in matched:
+                return category, f"mentions '{matched[category]}'"
+        if self.has_required and "required" not in matched:
+            return "required", "mentions none of the required keywords"
+        if self.max_years_required is not None:
+            years = [int(value) for value in YEARS_REQUIRED_PATTERN.findall(normalize(description))]
+            if years and min(years) > self.max_years_required:
+                return "experience", f"asks for {min(years)}+ years of experience"
+        return None
+
+    def check(self, job) -> bool:
+        """Returns whether `job`'s description passes, printing the reason when it does not."""
+        with self._lock:
+            if job.job_id in self._verdicts:
+                return self._verdicts[job.job_id]
+        rejection = self.rejection_reason(job) if job.description else None
+        with self._lock:
+            self.checked += 1
+            if rejection:
+                self.rejected += 1
+                self.rejections[rejection[0]] = self.rejections.get(rejection[0], 0) + 1
+            self._verdicts[job.job_id] = rejection is None
+        if rejection:
+            print(f"🚫 Description of {job.title} at {job.company} {rejection[1]}, skipping...")
+        return rejection is None
+
+    def report(self) -> str:
+        with self._lock:
+            reasons = ", ".join(f"{category}: {count}" for category, count in sorted(self.rejections.items())) or "none"
+            top_hits = sorted(self.keyword_hits.items(), key=lambda item: item[1], reverse=True)[:5]
+            hits = ", ".join(f"'{entry}' x{count}" for entry, count in top_hits) or "none"
+            return (f"Description filter: {self.rejected} of {self.checked} description(s) rejected ({reasons}); "
+                    f"most frequent matches: {hits}")
@@ -0,0 +1,115 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+import threading
+import src.utils as utils
+from src.job_clusters import JobClusters
+
+# Components of a worker process, built once by _init_worker
+_worker = {}
+# The resume builder makes about one LLM call per resume section, through its own client
+RESUME_RENDER_CALLS = 8
+
+
+def _init_worker(openai_api_key: str, parsed_resume, parameters: dict, cover_letter_dir: Path) -> None:
+    from lib_resume_builder_AIHawk import Resume, StyleManager, FacadeManager, ResumeGenerator
+    from src.gpt import GPTAnswerer
+    from src.llm_rate_limiter import RateLimiter
+    from src.job_application_profile import JobApplicationProfile
+    from src.cover_letter import CoverLetterService
+
+    resume_object = Resume(parsed_resume.text)
+    _worker["resume_generator_manager"] = FacadeManager(
+        openai_api_key, StyleManager(), ResumeGenerator(), resume_object, Path("data_folder/output")
+    )
+    _worker["rate_limiter"] = RateLimiter.from_parameters(parameters)
+    _worker["resume_tokens"] = len(parsed_resume.text) // 4
+    gpt_answerer = GPTAnswerer(openai_api_key, rate_limiter=_worker["rate_limiter"])
+    gpt_answerer.set_resume(resume_object)
+    gpt_answerer.set_job_application_profile(JobApplicationProfile(parsed_resume.data))
+    _worker["cover_letter_service"] = CoverLetterService(
+        gpt_answerer, cover_letter_dir, max_files=(parameters.get('cover_letters') or {}).get('max_files', 100)
+    )
+
+
+def _render_resume(description: str) -> str:
+    # the builder's calls bypass GPTAnswerer: charge their estimated cost to the shared budget up front
+    tokens_per_call = _worker["resume_tokens"] + len(description) // 4 + 500
+    _worker["rate_limiter"].acquire(RESUME_RENDER_CALLS * tokens_per_call, requests=RESUME_RENDER_CALLS)
+    return _worker["resume_generator_manager"].pdf_base64(job_description_text=description)
+
+
+def _write_cover_letter(job) -> str:
+    return _worker["cover_letter_service"].pdf(job)
+
+
+class DocumentPregenerator:
+    """Generates the tailored resume and cover letter of queued jobs ahead of time in a process pool.
+
+    Discovery submits each job as it is queued; the PDFs are rendered in worker processes (each
+    with its own resume builder and GPTAnswerer), so rendering uses several cores and never
+    runs on a browser thread. Apply workers hand the futures to the applier, whose upload step
+    then picks up a ready file, or waits for the one still being rendered.
+    """
+
+    def __init__(self, openai_api_key: str, parsed_resume, parameters: dict, tailored_resume_cache,
+                 process_workers: int = 2, generate_resume: bool = True):
+        self.tailored_resume_cache = tailored_resume_cache
+        self.job_clusters = JobClusters.from_parameters(parameters)
+        self.generate_resume = generate_resume
+        cover_letter_dir = Path(parameters['outputFileDirectory']) / "cover_letters"
+        # 'pregeneration' makes the workers' rate limiters use the budget file shared with this process
+        worker_parameters = {key: parameters.get(key) for key in ('llm', 'pregeneration', 'cover_letters', 'outputFileDirectory')}
+        # spawned, not forked: this process already runs Selenium and worker threads
+        self._processes = ProcessPoolExecutor(max_workers=process_workers, mp_context=multiprocessing.get_context("spawn"),
+                                              initializer=_init_worker,
+                                              initargs=(openai_api_key, parsed_resume, worker_parameters, cover_letter_dir))
+        # Bridges process results into the tailored resume cache without blocking discovery
+        self._threads = ThreadPoolExecutor(max_workers=process_workers * 2, thread_name_prefix="pregeneration")
+        self.futures = {}
+        self.submitted = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict, openai_api_key: str, parsed_resume, tailored_resume_cache):
+        """Builds the pregenerator from the `pregeneration` section of config.yaml, or returns None when disabled."""
+        options = parameters.get('pregeneration') or {}
+        if not options.get('enabled', False):
+            return None
+        has_resume = bool(parameters.get('uploads', {}).get('resume'))
+        return cls(openai_api_key, parsed_resume, parameters, tailored_resume_cache,
+                   process_workers=options.get('process_workers', 2), generate_resume=not has_resume)
+
+    def submit(self, job) -> None:
+        """Starts generating the documents of a queued job whose description is already fetched."""
+        if not job.description:
+            return
+        futures = {"cover_letter_pdf": self._processes.submit(_write_cover_letter, job)}
+        if self.generate_resume:
+            futures["resume"] = self._threads.submit(self._resume_path, self._resume_description(job))
+        with self._lock:
+            self.futures[job.job_id] = futures
+            self.submitted += 1
+
+    def _resume_description(self, job) -> str:
+        return self.job_clusters.representative_description(job) if self.job_clusters else job.description
+
+    def _resume_path(self, description: str) -> str:
+        return self.tailored_resume_cache.get_or_create(
+            description, lambda text: self._processes.submit(_render_resume, text).result()
+        )
+
+    def take(self, job) -> dict:
+        """Futures of the documents started for `job`, if any."""
+        with self._lock:
+            return self.futures.pop(job.job_id, {})
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for futures in self.futures.values():
+                for future in futures.values():
+                    future.cancel()
+            self.futures.clear()
+        self._threads.shutdown(wait=True)
+        self._processes.shutdown(wait=True)
+        utils.printyellow(f"🖨️ Pre-generated documents for {self.submitted} job(s).")
@@ -0,0 +1,143 @@
+import math
+import re
+import threading
+from pathlib import Path
+import numpy as np
+from src.resume_yaml import ParsedResume
+
+STOPWORDS = frozenset("""
+a about an and are as at be by for from has have in is it its of on or our that the their this to we
+will with you your who what which all any can may more must not other such than them they us was were
+""".split())
+
+# Sections of plain_text_resume.yaml describing what the candidate can do
+RESUME_SECTIONS = ("experience_details", "projects", "certifications", "education_details", "interests", "achievements")
+
+
+def tokenize(text: str) -> list:
+    return [token for token in re.findall(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]", (text or "").lower())
+            if token not in STOPWORDS]
+
+
+def _flatten(value, keys: bool = False) -> list:
+    """All strings nested in a YAML value. Keys are field names ("company", "skills"), so only
+    the keys of `exam` mappings count: they name the exams."""
+    if isinstance(value, dict):
+        return [text for key, item in value.items()
+                for text in ([str(key)] if keys else []) + _flatten(item, keys=key == "exam")]
+    if isinstance(value, list):
+        return [text for item in value for text in _flatten(item)]
+    return [str(value)] if value is not None else []
+
+
+class FitScorer:
+    """Scores how well jobs fit the resume with a local BM25-weighted term model, no API calls.
+
+    The score of a job is the share of its BM25 term weight (term frequency saturated by
+    document length, times IDF over every job scored in the run) carried by terms that also
+    appear in the resume's skills, experience, projects and certifications. It ranges from 0
+    (nothing in common) to 1, and works the same on a tile title or a full description, so
+    tiles are scored before their page is opened and descriptions once they are fetched.
+    Jobs below `min_score` are skipped, or only moved to the back with `action: deprioritise`.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, resume_text: str, min_score: float = 0.2, action: str = "skip", k1: float = 1.2, b: float = 0.75):
+        self.resume_terms = set(tokenize(resume_text))
+        self.min_score = min_score
+        self.skip = action == "skip"
+        self.k1 = k1
+        self.b = b
+        self.document_count = 0
+        self.document_frequency = {}
+        self.average_length = 0.0
+        self.scored = self.below_threshold = 0
+        self._verdicts = {}  # job ID -> whether its description passed
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict):
+        """Returns the scorer shared by every job manager of the run, or None when `fit_scoring` is disabled."""
+        options = parameters.get('fit_scoring') or {}
+        if not options.get('enabled', False):
+            return None
+        key = Path(parameters['outputFileDirectory'])
+        with cls._instances_lock:
+            if key not in cls._instances:
+                resume = ParsedResume.from_parameters(parameters).data or {}
+                resume_text = " ".join(text for section in RESUME_SECTIONS for text in _flatten(resume.get(section)))
+                if not tokenize(resume_text):
+                    # every job would score 0 and be skipped
+                    print("⚠️ The plain text resume has no skills or experience to score jobs against, fit scoring is disabled.")
+                    cls._instances[key] = None
+                else:
+                    cls._instances[key] = cls(resume_text, min_score=options.get('min_score', 0.2),
+                                              action=options.get('action', 'skip'))
+            return cls._instances[key]
+
+    def score(self, texts: list) -> list:
+        """Fit scores of a batch of texts, computed together as one matrix."""
+        documents = [tokenize(text) for text in texts]
+        self._update_corpus(documents)
+        vocabulary = {term: index for index, term in enumerate(sorted({term for document in documents for term in document}))}
+        if not vocabulary:
+            return [0.0] * len(texts)
+
+        counts = np.zeros((len(documents), len(vocabulary)))
+        for row, document in enumerate(documents):
+            for term in document:
+                counts[row, vocabulary[term]] += 1
+        terms = list(vocabulary)
+        idf = np.array([math.log((self.document_count + 1) / (self.document_frequency[term] + 1)) + 1 for term in terms])
+        in_resume = np.array([term in self.resume_terms for term in terms], dtype=float)
+        lengths = counts.sum(axis=1, keepdims=True)
+        saturated = counts * (self.k1 + 1) / (counts + self.k1 * (1 - self.b + self.b * lengths / max(self.average_length, 1.0)))
+        weights = saturated * idf
+        totals = weights.sum(axis=1)
+        scores = np.divide(weights @ in_resume, totals, out=np.zeros_like(totals), where=totals > 0)
+        return scores.tolist()
+
+    def _update_corpus(self, documents: list) -> None:
+        for document in documents:
+            for term in set(document):
+                self.document_frequency[term] = self.document_frequency.get(term, 0) + 1
+        total_length = self.average_length * self.document_count + sum(len(document) for document in documents)
+        self.document_count += len(documents)
+        self.average_length = total_length / self.document_count if self.document_count else 0.0
+
+    def filter(self, jobs: list, use_description: bool = False) -> list:
+        """Sets `job.fit_score` on a batch of jobs and returns the ones to keep, best fits first.
+
+        Jobs below `min_score` are dropped when skipping, or kept at the end when deprioritising.
+        """
+        if not jobs:
+            return []
+        texts = [job.description if use_description and job.description else job.title for job in jobs]
+        with self._lock:  # the corpus statistics are shared by every worker
+            scores = self.score(texts)
+            for job, score in zip(jobs, scores):
+                job.fit_score = round(score, 3)
+            below = [job for job in jobs if job.fit_score < self.min_score]
+            self.scored += len(jobs)
+            self.below_threshold += len(below)
+        for job in below:
+            print(f"📉 {job.title} at {job.company} fits the resume poorly ({job.fit_score:.0%})"
+                  f"{', skipping' if self.skip else ', deprioritising'}.")
+        kept = [job for job in jobs if job.fit_score >= self.min_score or not self.skip]
+        return sorted(kept, key=lambda job: job.fit_score, reverse=True)
+
+    def check(self, job) -> bool:
+        """Whether `job`'s description is kept, scored once per job ID however many times it is checked."""
+        with self._lock:
+            if job.job_id in self._verdicts:
+                return self._verdicts[job.job_id]
+        kept = bool(self.filter([job], use_description=True))
+        with self._lock:
+            self._verdicts[job.job_id] = kept
+        return kept
+
+    def report(self) -> str:
+        verb = "skipped" if self.skip else "deprioritised"
+        return f"Fit scoring: {self.below_threshold} of {self.scored} scored job(s) below {self.min_score:.0%}, {verb}"
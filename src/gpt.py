@@ -2,14 +2,13 @@ import json
 import os
 import textwrap
 import re
+import threading
 import src.strings as strings
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, List
 from pathlib import Path
 from dotenv import load_dotenv
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain_core.output_parsers import StrOutputParser
+from src.llm_rate_limiter import RateLimiter
 
 load_dotenv()
 
@@ -38,9 +37,65 @@ class LLMLogger:
             f.write(json_string + "\n")
 
 
+class SingleFlight:
+    """Lets identical concurrent calls share one outstanding call and its result.
+
+    The first caller for a key runs the call; callers arriving with the same key while it is
+    in flight wait for it and get the same result (or exception). Nothing is kept once the
+    call finishes, so this only removes duplicate work, it never serves stale answers.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced_calls = 0
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+                self.calls += 1
+            else:
+                self.coalesced_calls += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def report(self) -> str:
+        with self._lock:
+            return f"{self.calls} LLM call(s), {self.coalesced_calls} identical concurrent request(s) coalesced"
+
+
 class GPTAnswerer:
-    def __init__(self, openai_api_key, model="gpt-4o"):
-        self.llm = ChatOpenAI(model_name=model, openai_api_key=openai_api_key, temperature=0.4)
+    def __init__(self, openai_api_key, model="gpt-4o", rate_limiter=None):
+        from langchain_openai import ChatOpenAI  # langchain takes seconds to import: only when an answerer is built
+
+        # Retries are handled by the shared rate limiter, not per client
+        self.llm = ChatOpenAI(model_name=model, openai_api_key=openai_api_key, temperature=0.4, max_retries=0)
+        self.rate_limiter = rate_limiter or RateLimiter.shared()
+        self.single_flight = SingleFlight()
         self.job_application_profile = None  # ✅ Fix: Store job application profile
         self.resume = None  # ✅ Fix: Store resume
 
@@ -54,9 +109,29 @@ class GPTAnswerer:
 
     def query(self, prompt: str) -> str:
         """Send a query to OpenAI's API and return the response."""
-        prompt_template = ChatPromptTemplate.from_template(prompt)
-        chain = prompt_template | self.llm | StrOutputParser()
-        return chain.invoke({})
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_core.output_parsers import StrOutputParser
+
+        # The prompt is sent as is: braces (e.g. from JSON or a job description) are not template variables
+        prompt_template = ChatPromptTemplate.from_template(prompt.replace("{", "{{").replace("}", "}}"))
+        chain = prompt_template | self.llm
+        estimated_tokens = len(prompt) // 4 + 500  # prompt (~4 chars per token) plus a typical reply
+
+        def invoke():
+            message = self.rate_limiter.call(lambda: chain.invoke({}), estimated_tokens=estimated_tokens)
+            self.rate_limiter.settle(estimated_tokens, self._used_tokens(message))
+            return StrOutputParser().invoke(message)
+
+        return self.single_flight.do(prompt, invoke)
+
+    @staticmethod
+    def _used_tokens(message):
+        """Total tokens the API reported for a reply, or None when it reported no usage."""
+        usage = getattr(message, "usage_metadata", None) or {}
+        if usage.get("total_tokens"):
+            return usage["total_tokens"]
+        token_usage = (getattr(message, "response_metadata", None) or {}).get("token_usage") or {}
+        return token_usage.get("total_tokens")
 
     def summarize_job_description(self, text: str) -> str:
         """Summarize a job description into a concise format."""
@@ -113,18 +188,47 @@ class GPTAnswerer:
         numbers = re.findall(r"\d+", response)
         return int(numbers[0]) if numbers else default_experience
 
-    def generate_cover_letter(self, job):
-        job_desc = job.description
-        ai_generated_text = self._generate_text(job_desc)  # Call AI Model
+    def answer_question_from_options(self, question: str, options: List[str]) -> str:
+        """
+        Choose the option that best answers the question; always returns one of `options`.
+        """
+        prompt = f"""
+        Using the following resume: {self.resume}
+        and job application profile: {self.job_application_profile},
+        answer the question: "{question}"
+        by choosing one of these options: {json.dumps(options)}
 
-        cover_letter = strings.coverletter_template.format(
-            job_title=job.title,
-            company_name=job.company,
-            job_description=job_desc,
-            generated_text=ai_generated_text
+        Respond with the exact text of the chosen option only.
+        """
+        response = self.query(prompt).strip().strip('"').lower()
+        for option in options:
+            if option.strip().lower() == response:
+                return option
+        for option in options:
+            if option.strip() and (option.strip().lower() in response or response and response in option.lower()):
+                return option
+        return options[-1]
+
+    def answer_question_date(self, question: str) -> date:
+        """
+        Answer a date question (e.g. the earliest start date); today when the reply holds no date.
+        """
+        prompt = (f"Based on the job application profile: {self.job_application_profile}, answer the question: "
+                  f"'{question}'. Today is {date.today().isoformat()}. Return only the date as YYYY-MM-DD.")
+        response = self.query(prompt)
+        match = re.search(r"\d{4}-\d{2}-\d{2}", response)
+        try:
+            return datetime.strptime(match.group(0), "%Y-%m-%d").date() if match else date.today()
+        except ValueError:
+            return date.today()
+
+    def generate_cover_letter(self, job) -> str:
+        """Write a cover letter for the job from its description and the resume."""
+        prompt = strings.coverletter_template.format(
+            job_description=job.formatted_job_information(),
+            resume=self.resume,
         )
-
-        return cover_letter
+        return self.query(prompt).strip()
 
     def resume_or_cover(self, phrase: str) -> str:
         """
@@ -1,5 +1,15 @@
+import re
 from dataclasses import dataclass
 
+JOB_ID_PATTERN = re.compile(r"(?:/jobs/view/|currentJobId=)(\d+)")
+
+
+def job_id_from_link(link: str) -> str:
+    """LinkedIn job ID parsed from a job link, or the link itself when it has no ID."""
+    match = JOB_ID_PATTERN.search(link or "")
+    return match.group(1) if match else link
+
+
 @dataclass
 class Job:
     title: str
@@ -11,6 +21,19 @@ class Job:
     summarize_job_description: str = ""
     pdf_path: str = ""
     recruiter_link: str = ""
+    cluster_id: str = ""
+    fit_score: float = 0.0
+    # Filled from the description by src.job_attributes.extract_job_attributes
+    work_mode: str = ""
+    salary_min: float = 0.0  # per year
+    salary_max: float = 0.0
+    salary_currency: str = ""
+    seniority: str = ""
+    visa_sponsorship: str = ""
+
+    @property
+    def job_id(self) -> str:
+        return job_id_from_link(self.link)
 
     def set_summarize_job_description(self, summarize_job_description):
         self.summarize_job_description = summarize_job_description
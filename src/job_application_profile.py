@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 from lib_resume_builder_AIHawk.resume import PersonalInformation
 import yaml
+from src.resume_yaml import parse
 
 @dataclass
 class SelfIdentification:
@@ -47,9 +48,10 @@ class JobApplicationProfile:
     availability: Availability
     salary_expectations: SalaryExpectations
 
-    def __init__(self, yaml_str: str):
+    def __init__(self, yaml_data):
+        """`yaml_data` is the YAML text or its already parsed tree (see src.resume_yaml.ParsedResume)."""
         try:
-            data = yaml.safe_load(yaml_str)
+            data = yaml_data if isinstance(yaml_data, dict) else parse(yaml_data)
         except yaml.YAMLError as e:
             raise ValueError("Error parsing YAML file.") from e
         except Exception as e:
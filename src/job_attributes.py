@@ -0,0 +1,240 @@
+import re
+import threading
+from pathlib import Path
+
+CURRENCIES = {
+    "$": "USD", "us$": "USD", "usd": "USD", "€": "EUR", "eur": "EUR", "£": "GBP", "gbp": "GBP",
+    "c$": "CAD", "cad": "CAD", "a$": "AUD", "aud": "AUD", "chf": "CHF", "₹": "INR", "inr": "INR",
+}
+_CURRENCY = r"us\$|c\$|a\$|\$|€|£|₹|usd|eur|gbp|cad|aud|chf|inr"
+# cents allowed: "95,000.00"; never a prefix of a longer number, so "$25M" cannot be read as "$2"
+_AMOUNT = r"(?:\d{1,3}(?:[,.\s]\d{3})+(?:[.,]\d{2}(?!\d))?|\d+(?:\.\d+)?)(?!\d|[.,]\d)"
+_PERIODS = r"year|yr|annum|annual|hour|hr|month|mo"
+_PERIOD = rf"(?:\s*(?:/|per|an|a)\s*(?P<period>{_PERIODS})\b)?"
+_RANGE = r"\s*(?:-|–|—|\bto\b)\s*"
+SALARY_PATTERN = re.compile(
+    # "$120,000 - $150,000", "USD 90k to 110k", "$95,000.00/yr - $120,000.00/yr", "between $80,000 and $100,000"
+    rf"(?:(?P<currency>{_CURRENCY})\s*(?P<low>{_AMOUNT})\s*(?P<low_k>k)?(?!\s*(?:million|billion|mm|bn|m|b)\b)"
+    rf"(?:\s*(?:/|per|an|a)\s*(?P<low_period>{_PERIODS})\b)?"
+    # "and" only before a second currency amount, not in "$50,000 and 401k"
+    rf"(?:(?:{_RANGE}(?:{_CURRENCY})?|\s*\band\s+(?:{_CURRENCY}))\s*(?P<high>{_AMOUNT})\s*(?P<high_k>k)?)?"
+    # "60.000 - 70.000 EUR", "55k EUR"
+    rf"|(?P<low_suffixed>{_AMOUNT})\s*(?P<low_suffixed_k>k)?"
+    rf"(?:{_RANGE}(?P<high_suffixed>{_AMOUNT})\s*(?P<high_suffixed_k>k)?)?\s*(?P<currency_suffix>{_CURRENCY})\b)"
+    rf"{_PERIOD}",
+    re.IGNORECASE,
+)
+MIN_HOURLY = 5  # smaller hourly amounts are prices or counts, not pay
+PERIOD_TO_YEAR = {"year": 1, "yr": 1, "annum": 1, "annual": 1, "month": 12, "mo": 12, "hour": 2080, "hr": 2080}
+
+LOCATION_WORK_MODE = re.compile(r"\((remote|hybrid|on-?site)\)", re.IGNORECASE)
+HYBRID = re.compile(r"\bhybrid\b", re.IGNORECASE)
+STRONG_REMOTE = re.compile(r"\b(?:fully remote|100% remote|remote[- ]first|work from home|remote (?:role|position|job))\b", re.IGNORECASE)
+ON_SITE = re.compile(r"\b(?:on-?site|in[- ]office|in person)\b", re.IGNORECASE)
+REMOTE = re.compile(r"\bremote\b", re.IGNORECASE)
+# "This is not a remote role", "non-remote", "remote work is not possible" say nothing in favour of remote
+NEGATED_REMOTE = re.compile(
+    r"\b(?:not|no|non)[- ](?:(?:an?|fully|100%)\s+)*remote\b|\bremote (?:work )?is not (?:possible|available|an option)\b",
+    re.IGNORECASE,
+)
+
+SENIORITY_PATTERNS = [
+    ("Internship", re.compile(r"\bintern(?:ship)?\b", re.IGNORECASE)),
+    ("Director", re.compile(r"\b(?:director|head of|vp|vice president)\b", re.IGNORECASE)),
+    ("Principal", re.compile(r"\bprincipal\b", re.IGNORECASE)),
+    ("Lead", re.compile(r"\b(?:lead|staff)\b", re.IGNORECASE)),
+    ("Senior", re.compile(r"\b(?:senior|sr\.?)(?=\s|$)", re.IGNORECASE)),
+    ("Entry", re.compile(r"\b(?:junior|jr\.?|entry[- ]level|graduate)(?=\s|$|[,)])", re.IGNORECASE)),
+    ("Mid", re.compile(r"\bmid[- ]level\b", re.IGNORECASE)),
+]
+# In descriptions only explicit levels count: "reports to the Director" says nothing about the role
+DESCRIPTION_SENIORITY_PATTERNS = [
+    ("Entry", re.compile(r"\bentry[- ]level\b", re.IGNORECASE)),
+    ("Mid", re.compile(r"\bmid[- ]level\b", re.IGNORECASE)),
+    ("Senior", re.compile(r"\bsenior[- ]level\b", re.IGNORECASE)),
+]
+VISA_NOT_OFFERED = re.compile(
+    r"\b(?:no (?:visa )?sponsorship|(?:unable|not able|cannot|can't|will not|won't|does not|do not) (?:to )?sponsor"
+    r"|without (?:visa )?sponsorship|must be an? u\.?s\.? citizen|u\.?s\.? citizens only)\b",
+    re.IGNORECASE,
+)
+VISA_OFFERED = re.compile(
+    r"\b(?:visa sponsorship (?:is )?(?:available|provided|offered)|(?:we|will) sponsor|sponsorship (?:is )?(?:available|provided|offered))\b",
+    re.IGNORECASE,
+)
+US_LOCATION = re.compile(r"\b(?:united states|usa|u\.s\.|us)\b", re.IGNORECASE)
+
+
+def _parse_amount(amount: str, thousands: bool) -> float:
+    grouped = re.fullmatch(r"(\d{1,3}(?:[,.\s]\d{3})+)(?:[.,](\d{2}))?", amount)
+    if grouped:
+        value = float(re.sub(r"[,.\s]", "", grouped.group(1))) + int(grouped.group(2) or 0) / 100
+    else:
+        value = float(amount)
+    return value * 1000 if thousands else value
+
+
+def extract_salary(text: str):
+    """(low, high, currency, period) of the first salary range in `text`, or None.
+
+    >>> extract_salary("Base pay range $95,000.00/yr - $120,000.00/yr")
+    (95000.0, 120000.0, 'USD', 'yr')
+    >>> extract_salary("$150,000.00 - $180,000.00 a year")
+    (150000.0, 180000.0, 'USD', 'year')
+    >>> extract_salary("between $80,000 and $100,000")
+    (80000.0, 100000.0, 'USD', 'year')
+    >>> extract_salary("We are a $12M startup. Salary $120,000 - $140,000")
+    (120000.0, 140000.0, 'USD', 'year')
+    """
+    for match in SALARY_PATTERN.finditer(text or ""):
+        currency = CURRENCIES[(match.group("currency") or match.group("currency_suffix")).lower()]
+        suffixed = match.group("currency") is None
+        low_k, high_k = ("low_suffixed_k", "high_suffixed_k") if suffixed else ("low_k", "high_k")
+        low = _parse_amount(match.group("low_suffixed" if suffixed else "low"), bool(match.group(low_k)))
+        high_text = match.group("high_suffixed" if suffixed else "high")
+        high = _parse_amount(high_text, bool(match.group(high_k))) if high_text else low
+        if high_text and match.group(high_k) and not match.group(low_k) and low < 1000:
+            low *= 1000  # "$120-150k"
+        period = (match.group("period") or match.group("low_period") or "").lower()
+        if not period:
+            period = "hour" if high < 500 else "year"
+        if high < low or (period in ("year", "yr", "annum", "annual") and high < 5000) \
+                or (period in ("hour", "hr") and low < MIN_HOURLY):
+            continue  # not a salary, e.g. "$5 off", "a $1.5 fee" or a year range
+        return low, high, currency, period
+    return None
+
+
+def extract_work_mode(description: str, location: str = "") -> str:
+    tagged = LOCATION_WORK_MODE.search(location or "")
+    if tagged:
+        return {"remote": "Remote", "hybrid": "Hybrid"}.get(tagged.group(1).lower(), "On-Site")
+    description = NEGATED_REMOTE.sub(" ", description or "")
+    if HYBRID.search(description):
+        return "Hybrid"
+    if STRONG_REMOTE.search(description):
+        return "Remote"
+    if ON_SITE.search(description):
+        return "On-Site"
+    if REMOTE.search(description):
+        return "Remote"
+    return ""
+
+
+def extract_seniority(title: str, description: str = "") -> str:
+    for level, pattern in SENIORITY_PATTERNS:
+        if pattern.search(title or ""):
+            return level
+    for level, pattern in DESCRIPTION_SENIORITY_PATTERNS:
+        if pattern.search(description or ""):
+            return level
+    return ""
+
+
+def extract_visa_sponsorship(description: str) -> str:
+    if VISA_NOT_OFFERED.search(description or ""):
+        return "not offered"
+    if VISA_OFFERED.search(description or ""):
+        return "offered"
+    return ""
+
+
+def extract_job_attributes(job) -> None:
+    """Fills the structured fields of `job` from its title, location and description."""
+    job.work_mode = extract_work_mode(job.description, job.location)
+    job.seniority = extract_seniority(job.title, job.description)
+    job.visa_sponsorship = extract_visa_sponsorship(job.description)
+    salary = extract_salary(job.description)
+    if salary:
+        low, high, currency, period = salary
+        job.salary_currency = currency
+        job.salary_min = low * PERIOD_TO_YEAR[period]
+        job.salary_max = high * PERIOD_TO_YEAR[period]
+
+
+class PreferenceFilter:
+    """Rejects jobs whose extracted attributes conflict with the job application profile.
+
+    Work mode is checked against WorkPreferences (remote_work, in_person_work), a USD salary
+    range against SalaryExpectations.salary_range_usd (other currencies are not converted), and
+    "no sponsorship" jobs against the US or EU sponsorship needs of LegalAuthorization.
+    Unknown attributes never reject a job.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, job_application_profile):
+        self.profile = job_application_profile
+        self.expected_salary = self._expected_salary(job_application_profile)
+        self.checked = self.rejected = 0
+        self.rejections = {}
+        self._verdicts = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict, job_application_profile):
+        """Returns the filter shared by the run when `preference_filter.enabled` is set in config.yaml, otherwise None."""
+        if not (parameters.get('preference_filter') or {}).get('enabled', False) or job_application_profile is None:
+            return None
+        key = Path(parameters['outputFileDirectory'])  # shared by every job manager of the run
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(job_application_profile)
+            return cls._instances[key]
+
+    @staticmethod
+    def _expected_salary(job_application_profile) -> float:
+        """Lower bound of the salary range in the profile, e.g. 90000 for "90000 - 110000"."""
+        salary_range = getattr(getattr(job_application_profile, "salary_expectations", None), "salary_range_usd", "")
+        amounts = re.findall(r"\d[\d,.]*\s*k?", str(salary_range or ""), re.IGNORECASE)
+        if not amounts:
+            return 0.0
+        amount = amounts[0].strip().lower()
+        return _parse_amount(amount.rstrip("k").strip().rstrip(",."), amount.endswith("k"))
+
+    @staticmethod
+    def _no(value) -> bool:
+        return str(value or "").strip().lower() in ("no", "false")
+
+    @staticmethod
+    def _yes(value) -> bool:
+        return str(value or "").strip().lower() in ("yes", "true")
+
+    def rejection_reason(self, job):
+        work_preferences = getattr(self.profile, "work_preferences", None)
+        if work_preferences:
+            if job.work_mode == "Remote" and self._no(work_preferences.remote_work):
+                return "work_mode", "is remote"
+            if job.work_mode in ("On-Site", "Hybrid") and self._no(work_preferences.in_person_work):
+                return "work_mode", f"is {job.work_mode.lower()}"
+        if self.expected_salary and job.salary_currency == "USD" and job.salary_max and job.salary_max < self.expected_salary:
+            return "salary", f"pays up to {job.salary_max:,.0f} USD a year, below {self.expected_salary:,.0f}"
+        legal = getattr(self.profile, "legal_authorization", None)
+        if legal and job.visa_sponsorship == "not offered":
+            in_us = job.salary_currency == "USD" or bool(US_LOCATION.search(job.location or ""))
+            needs_sponsorship = legal.requires_us_sponsorship if in_us else legal.requires_eu_sponsorship
+            if self._yes(needs_sponsorship):
+                return "visa", "offers no visa sponsorship"
+        return None
+
+    def check(self, job) -> bool:
+        """Returns whether `job` fits the profile, printing the reason when it does not."""
+        with self._lock:
+            if job.job_id in self._verdicts:
+                return self._verdicts[job.job_id]
+        rejection = self.rejection_reason(job)
+        with self._lock:
+            self.checked += 1
+            if rejection:
+                self.rejected += 1
+                self.rejections[rejection[0]] = self.rejections.get(rejection[0], 0) + 1
+            self._verdicts[job.job_id] = rejection is None
+        if rejection:
+            print(f"🚫 {job.title} at {job.company} {rejection[1]}, skipping...")
+        return rejection is None
+
+    def report(self) -> str:
+        with self._lock:
+            reasons = ", ".join(f"{reason}: {count}" for reason, count in sorted(self.rejections.items())) or "none"
+            return f"Preference filter: {self.rejected} of {self.checked} job(s) rejected ({reasons})"
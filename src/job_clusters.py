@@ -0,0 +1,128 @@
+import json
+import random
+import threading
+from pathlib import Path
+from src.resume_cache import TailoredResumeCache
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+class JobClusters:
+    """Groups jobs with near-identical descriptions (reposts, agency copies) as they are discovered.
+
+    Each description gets a MinHash signature over its word shingles; locality-sensitive
+    hashing on bands of the signature finds candidate clusters without comparing against
+    every earlier job, and a job joins the candidate with the highest estimated Jaccard
+    similarity if it reaches `threshold`, otherwise it starts a new cluster. The first member's description
+    is the cluster's representative, which artifacts are generated from so the whole cluster
+    shares them. Clusters are kept in the output folder across runs, as a log that each
+    assignment appends one line to.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Path, threshold: float = 0.8, num_perm: int = 64, bands: int = 16):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.rows = num_perm // bands
+        self.bands = bands
+        seeded = random.Random(1)  # fixed, so signatures stay comparable across runs
+        self._permutations = [(seeded.randrange(1, _MERSENNE_PRIME), seeded.randrange(0, _MERSENNE_PRIME))
+                              for _ in range(num_perm)]
+        self.clusters, self.jobs = self._load()
+        self._buckets = {}
+        for cluster_id, cluster in self.clusters.items():
+            self._index(cluster_id, cluster["signature"])
+        self.assigned = self.joined = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict):
+        """Returns the clusters shared by every job manager writing to the same output folder, or None when disabled."""
+        options = parameters.get('clustering') or {}
+        if not options.get('enabled', False):
+            return None
+        path = Path(parameters['outputFileDirectory']) / "job_clusters.jsonl"
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path, threshold=options.get('threshold', 0.8))
+            return cls._instances[path]
+
+    def signature(self, description: str) -> list:
+        shingles = TailoredResumeCache.shingles(TailoredResumeCache.normalize(description))
+        return [min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles) for a, b in self._permutations]
+
+    def _band_keys(self, signature: list) -> list:
+        return [(band, tuple(signature[band * self.rows:(band + 1) * self.rows])) for band in range(self.bands)]
+
+    def _index(self, cluster_id: str, signature: list) -> None:
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, []).append(cluster_id)
+
+    @staticmethod
+    def _similarity(signature: list, other: list) -> float:
+        return sum(1 for a, b in zip(signature, other) if a == b) / len(signature)
+
+    def assign(self, job) -> str:
+        """Sets and returns `job.cluster_id`, joining the most similar existing cluster or starting a new one."""
+        if not job.description:
+            return job.cluster_id
+        with self._lock:
+            cluster_id = self.jobs.get(job.job_id)
+            if cluster_id is None:
+                signature = self.signature(job.description)
+                candidates = {cluster_id for key in self._band_keys(signature) for cluster_id in self._buckets.get(key, [])}
+                scored = [(self._similarity(signature, self.clusters[candidate]["signature"]), candidate) for candidate in candidates]
+                best_similarity, cluster_id = max(scored, default=(0.0, None))
+                if cluster_id is not None and best_similarity >= self.threshold:
+                    self.joined += 1
+                    self.clusters[cluster_id]["members"].append(job.job_id)
+                    self._append({"job": job.job_id, "cluster": cluster_id})
+                else:
+                    cluster_id = job.job_id
+                    self.clusters[cluster_id] = {"representative": job.description, "signature": signature,
+                                                 "members": [job.job_id]}
+                    self._index(cluster_id, signature)
+                    self._append({"job": job.job_id, "cluster": cluster_id, "representative": job.description,
+                                  "signature": signature})
+                self.jobs[job.job_id] = cluster_id
+                self.assigned += 1
+        job.cluster_id = cluster_id
+        return cluster_id
+
+    def representative_description(self, job) -> str:
+        """Description the cluster's shared artifacts are generated from (the job's own when unclustered)."""
+        with self._lock:
+            cluster = self.clusters.get(job.cluster_id)
+        return cluster["representative"] if cluster else job.description
+
+    def report(self) -> str:
+        with self._lock:
+            return (f"Clusters: {self.assigned} job(s) assigned, {self.joined} joined an existing cluster, "
+                    f"{len(self.clusters)} cluster(s) in total")
+
+    def _load(self) -> tuple:
+        """Replays the log: a line with a representative starts a cluster, any other joins one."""
+        clusters, jobs = {}, {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        job_id, cluster_id = record["job"], record["cluster"]
+                        if "representative" in record:
+                            clusters[cluster_id] = {"representative": record["representative"],
+                                                    "signature": record["signature"], "members": []}
+                        clusters[cluster_id]["members"].append(job_id)
+                    except (json.JSONDecodeError, KeyError):
+                        continue  # e.g. a line cut short by a crash
+                    jobs[job_id] = cluster_id
+        except FileNotFoundError:
+            pass
+        return clusters, jobs
+
+    def _append(self, record: dict) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
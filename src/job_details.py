@@ -0,0 +1,65 @@
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver import ActionChains
+import src.pacing as pacing
+
+
+class JobDetailsFetcher:
+    """Opens job pages and fetches description and recruiter lazily, cached by job ID.
+
+    Only jobs that survived the cheap tile-level filters are passed here, so the page
+    navigation and DOM reads are never spent on blacklisted or already seen jobs.
+    """
+
+    def __init__(self, driver, prefetcher=None):
+        self.driver = driver
+        self.prefetcher = prefetcher
+        self.cache = {}
+
+    def open(self, job) -> None:
+        """Shows the job page, switching to its prefetched tab or navigating to it."""
+        if job.job_id in self.driver.current_url:
+            return
+        if not (self.prefetcher and self.prefetcher.activate(job)):
+            self.driver.get(job.link)
+        try:
+            WebDriverWait(self.driver, 10).until(
+                lambda d: d.execute_script('return document.readyState') == 'complete'
+            )
+        except TimeoutException:
+            print(f"⚠️ Job page load timed out for {job.title} at {job.company}.")
+
+    def fetch(self, job) -> None:
+        """Fills `job.description` and `job.recruiter_link`, opening the job page only on a cache miss."""
+        cached = self.cache.get(job.job_id)
+        if cached is None:
+            self.open(job)
+            cached = (self._get_job_description(), self._get_job_recruiter())
+            self.cache[job.job_id] = cached
+        description, recruiter_link = cached
+        job.set_job_description(description)
+        job.set_recruiter_link(recruiter_link)
+
+    def _get_job_description(self) -> str:
+        try:
+            see_more_buttons = self.driver.find_elements(By.XPATH, '//button[@aria-label="Click to see more description"]')
+            if see_more_buttons:
+                ActionChains(self.driver).move_to_element(see_more_buttons[0]).click().perform()
+                pacing.pause("after_click")
+            return self.driver.find_element(By.CLASS_NAME, 'jobs-description-content__text').text
+        except NoSuchElementException:
+            print("Error: Job description not found.")
+        except Exception:
+            print("Error getting Job description.")
+        return ""
+
+    def _get_job_recruiter(self) -> str:
+        try:
+            hiring_team_sections = self.driver.find_elements(By.XPATH, '//h2[text()="Meet the hiring team"]')
+            if not hiring_team_sections:
+                return ""
+            recruiter_element = hiring_team_sections[0].find_element(By.XPATH, './/following::a[contains(@href, "linkedin.com/in/")]')
+            return recruiter_element.get_attribute('href')
+        except Exception:
+            return ""
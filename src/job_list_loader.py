@@ -0,0 +1,70 @@
+import src.pacing as pacing
+
+TILE_SELECTOR = "li.job-card-container"
+TILE_TITLE_SELECTOR = "div.artdeco-entity-lockup__title a"
+END_OF_LIST_SELECTOR = ".jobs-search-pagination, .artdeco-pagination, .jobs-search-two-pane__pagination"
+
+# One round-trip per step: count rendered and hydrated tiles, detect the end of the list
+# (scrolled to the bottom or a pagination sentinel in view) and bring the last rendered
+# tile into view so the next batch gets rendered.
+_LOAD_STEP_SCRIPT = """
+const container = arguments[0];
+const tiles = container.querySelectorAll(arguments[1]);
+let hydrated = 0;
+for (const tile of tiles) {
+    if (tile.querySelector(arguments[2])) hydrated++;
+}
+// the results list itself does not scroll: measure the nearest scrollable ancestor (or the page)
+let scroller = container;
+while (scroller && !(scroller.scrollHeight > scroller.clientHeight + 2
+                     && /(auto|scroll)/.test(getComputedStyle(scroller).overflowY))) {
+    scroller = scroller.parentElement;
+}
+scroller = scroller || document.scrollingElement;
+const atBottom = scroller.scrollHeight - scroller.scrollTop - scroller.clientHeight <= 2;
+const sentinel = document.querySelector(arguments[3]);
+let sentinelVisible = false;
+if (sentinel) {
+    const rect = sentinel.getBoundingClientRect();
+    sentinelVisible = rect.top < window.innerHeight && rect.bottom > 0;
+}
+if (tiles.length) tiles[tiles.length - 1].scrollIntoView({block: "end"});
+return [tiles.length, hydrated, atBottom || sentinelVisible];
+"""
+
+_HYDRATED_TILES_SCRIPT = """
+return Array.from(arguments[0].querySelectorAll(arguments[1])).filter(tile => tile.querySelector(arguments[2]));
+"""
+
+
+class JobListLoader:
+    """Scrolls the search results list only until the wanted number of tiles are hydrated.
+
+    LinkedIn virtualizes the results list: tiles outside the viewport are rendered as empty
+    placeholders. Instead of sweeping a fixed pixel range, the loader jumps to the last rendered
+    tile and stops as soon as enough tiles carry their content, the end of the list is visible,
+    or no new tiles appear for `stall_rounds` consecutive steps.
+    """
+
+    def __init__(self, driver, max_rounds: int = 15, stall_rounds: int = 2):
+        self.driver = driver
+        self.max_rounds = max_rounds
+        self.stall_rounds = stall_rounds
+
+    def load(self, container, expected_tiles: int) -> list:
+        last_hydrated = -1
+        stalled = 0
+        for round_number in range(1, self.max_rounds + 1):
+            total, hydrated, at_end = self.driver.execute_script(
+                _LOAD_STEP_SCRIPT, container, TILE_SELECTOR, TILE_TITLE_SELECTOR, END_OF_LIST_SELECTOR
+            )
+            if hydrated >= expected_tiles or (at_end and total and hydrated == total):
+                break
+            stalled = stalled + 1 if hydrated <= last_hydrated else 0
+            if stalled >= self.stall_rounds:
+                break
+            last_hydrated = hydrated
+            pacing.pause("list_step")
+
+        print(f"✅ Job list hydrated: {hydrated}/{total} tiles after {round_number} step(s).")
+        return self.driver.execute_script(_HYDRATED_TILES_SCRIPT, container, TILE_SELECTOR, TILE_TITLE_SELECTOR) or []
@@ -0,0 +1,200 @@
+import queue
+import threading
+import time
+import src.utils as utils
+import src.pacing as pacing
+from src.browser_bootstrap import init_browsers
+from src.worker_pool import clone_chrome_profile
+
+
+class StageMetrics:
+    """Counts items and busy time of one pipeline stage across its workers."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, busy_seconds: float, items: int = 1, wait_seconds: float = 0.0) -> None:
+        with self._lock:
+            self.items += items
+            self.busy_seconds += busy_seconds
+            self.wait_seconds += wait_seconds
+
+    def report(self, workers: int, elapsed: float) -> str:
+        with self._lock:
+            rate = self.items / elapsed * 60 if elapsed else 0
+            utilization = self.busy_seconds / (elapsed * workers) * 100 if elapsed and workers else 0
+            return (f"{self.name}: {self.items} jobs by {workers} worker(s), {rate:.1f} jobs/min, "
+                    f"{utilization:.0f}% busy, {self.wait_seconds:.0f}s waiting on the queue")
+
+
+class JobPipeline:
+    """Discovery → apply producer/consumer pipeline over a persistent JobQueue.
+
+    Discovery workers page through searches and push filtered jobs into the queue; apply
+    workers pull the highest priority job and apply to it. Each stage runs in its own Chrome
+    instances, so the discovery browser keeps finding jobs while the apply browsers wait on
+    LLM calls and form steps, and the queue's `max_pending` bound provides the backpressure.
+    With a `pregenerator`, discovery also fetches the description of each job it queues so its
+    documents are generated before an apply worker gets to it.
+    """
+
+    def __init__(self, job_queue, build_job_manager, discovery_workers: int = 1, apply_workers: int = 1,
+                 headless: bool = False, capture_network: bool = False, pregenerator=None):
+        self.job_queue = job_queue
+        self.pregenerator = pregenerator
+        self.build_job_manager = build_job_manager
+        self.discovery_workers = max(1, discovery_workers)
+        self.apply_workers = max(1, apply_workers)
+        self.headless = headless
+        self.capture_network = capture_network
+        self.seen_jobs = set()
+        self.discovery_metrics = StageMetrics("Discovery")
+        self.apply_metrics = StageMetrics("Apply")
+        self.job_manager = None  # any worker's job manager, for the run-wide reports
+        self.live_apply_workers = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def priority(job) -> float:
+        """Easy Apply jobs are cheaper to complete, so they are applied to first, best fits first."""
+        return (1.0 if job.apply_method == "Easy Apply" else 0.0) + job.fit_score
+
+    def run(self, searches) -> None:
+        search_queue = queue.Queue()
+        for search in searches:
+            search_queue.put(search)
+
+        worker_count = self.discovery_workers + self.apply_workers
+        profile_paths = [clone_chrome_profile(worker_id) for worker_id in range(1, worker_count + 1)]
+        browsers = init_browsers(profile_paths, headless=self.headless, capture_network=self.capture_network)
+
+        started = time.perf_counter()
+        self.live_apply_workers = self.apply_workers
+        discovery_threads = [
+            threading.Thread(target=self._discover, args=(worker_id, browser, search_queue), name=f"discovery-{worker_id}")
+            for worker_id, browser in enumerate(browsers[:self.discovery_workers], start=1)
+        ]
+        apply_threads = [
+            threading.Thread(target=self._apply, args=(worker_id, browser), name=f"apply-{worker_id}")
+            for worker_id, browser in enumerate(browsers[self.discovery_workers:], start=1)
+        ]
+        for thread in discovery_threads + apply_threads:
+            thread.start()
+        for thread in discovery_threads:
+            thread.join()
+        self.job_queue.close()
+        for thread in apply_threads:
+            thread.join()
+        if self.pregenerator:
+            self.pregenerator.shutdown()
+
+        elapsed = time.perf_counter() - started
+        utils.printyellow(f"📊 {self.discovery_metrics.report(self.discovery_workers, elapsed)}")
+        utils.printyellow(f"📊 {self.apply_metrics.report(self.apply_workers, elapsed)}")
+        utils.printyellow(f"📊 Queue: {self.job_queue.stats()}")
+        if self.job_manager is not None:
+            self.job_manager.report_run()
+
+    def _discover(self, worker_id: int, browser, search_queue: queue.Queue) -> None:
+        try:
+            job_manager = self.build_job_manager(browser)
+            with self._lock:
+                self.job_manager = job_manager
+                self.seen_jobs.update(job_manager.seen_jobs)
+            job_manager.seen_jobs = self.seen_jobs
+            while not self.job_queue.closed:
+                try:
+                    position, location = search_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    self._discover_search(job_manager, position, location)
+                except Exception as e:
+                    # one broken search must not drop the rest of the queue
+                    utils.printred(f"⚠️ Error discovering jobs for {position} in {location}: {e}")
+        except Exception as e:
+            utils.printred(f"❌ Discovery worker {worker_id} stopped: {e}")
+        finally:
+            browser.quit()
+
+    @staticmethod
+    def _fetch_details(job_manager, job) -> None:
+        try:
+            job_manager.fetch_job_details(job)
+        except Exception as e:
+            # the apply worker fetches again when it opens the job
+            utils.printred(f"⚠️ Could not fetch details for {job.title}: {e}")
+
+    def _discover_search(self, job_manager, position: str, location: str) -> None:
+        utils.printyellow(f"🚀 Discovering jobs for {position} in {location}.")
+        job_page_number = 1
+        while not self.job_queue.closed:
+            started = time.perf_counter()
+            job_manager.next_job_page(position, location, job_page_number)
+            pacing.pause("page_load")
+            job_list = job_manager.extract_page_jobs()
+            candidates = job_manager.filter_jobs(job_list)
+            busy = time.perf_counter() - started
+
+            if self.pregenerator:
+                started = time.perf_counter()
+                for job in candidates:
+                    self._fetch_details(job_manager, job)
+                # no documents for jobs the apply worker would reject on their description
+                rejected = [job for job in candidates if not job_manager.passes_description_checks(job)]
+                for job in rejected:
+                    job_manager.write_to_file(job, "skipped")
+                candidates = [job for job in candidates if job not in rejected]
+                busy += time.perf_counter() - started
+
+            waited = time.perf_counter()
+            queued = 0
+            for job in candidates:
+                if self.job_queue.put(job, self.priority(job)):
+                    queued += 1
+                    if self.pregenerator:
+                        self.pregenerator.submit(job)
+            self.discovery_metrics.record(busy, items=queued, wait_seconds=time.perf_counter() - waited)
+
+            if not job_manager.search_scheduler.record_page(position, location, job_page_number, job_list, candidates):
+                return
+            job_page_number += 1
+            pacing.pause("between_pages")
+
+    def _apply(self, worker_id: int, browser) -> None:
+        try:
+            job_manager = self.build_job_manager(browser)
+            with self._lock:
+                self.job_manager = job_manager
+            while True:
+                waited = time.perf_counter()
+                job = self.job_queue.get()
+                wait_seconds = time.perf_counter() - waited
+                if job is None:
+                    break
+                started = time.perf_counter()
+                applier = job_manager.get_easy_applier()
+                if self.pregenerator:
+                    applier.document_futures[job.job_id] = self.pregenerator.take(job)
+                try:
+                    succeeded = job_manager.apply_to_job(job)
+                finally:
+                    applier.document_futures.pop(job.job_id, None)
+                self.job_queue.mark(job, "done" if succeeded else "failed")
+                self.apply_metrics.record(time.perf_counter() - started, wait_seconds=wait_seconds)
+            job_manager.report_network()
+        except Exception as e:
+            utils.printred(f"❌ Apply worker {worker_id} stopped: {e}")
+        finally:
+            browser.quit()
+            with self._lock:
+                self.live_apply_workers -= 1
+                last_worker = self.live_apply_workers == 0
+            if last_worker and not self.job_queue.closed:
+                # nobody left to drain the queue: stop discovery instead of blocking on a full queue
+                utils.printred("❌ No apply worker left, stopping discovery.")
+                self.job_queue.close()
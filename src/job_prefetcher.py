@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+
+class JobPrefetcher:
+    """Loads upcoming job pages in background tabs while the current job is being processed.
+
+    At most `max_tabs` prefetched tabs are open at a time. `activate` switches to the tab of
+    the job about to be processed, and `release` closes it and returns to the results tab.
+    """
+
+    def __init__(self, driver, max_tabs: int = 2):
+        self.driver = driver
+        self.max_tabs = max_tabs
+        self.tabs = OrderedDict()  # job_id -> window handle
+        self.home_handle = None
+        self.active_handle = None
+        self.network_policy = None  # NetworkPolicy, set by the job manager when enabled
+
+    def prefetch(self, jobs) -> None:
+        """Opens background tabs for the next jobs until the tab pool is full."""
+        if self.max_tabs <= 0:
+            return
+        if self.home_handle is None:
+            self.home_handle = self.driver.current_window_handle
+        for job in jobs:
+            if len(self.tabs) >= self.max_tabs:
+                break
+            if job.job_id in self.tabs:
+                continue
+            handles_before = set(self.driver.window_handles)
+            # window.open keeps the driver on the current tab, so the new page loads in the background
+            self.driver.execute_script("window.open(arguments[0], '_blank');",
+                                       "about:blank" if self.network_policy else job.link)
+            new_handles = set(self.driver.window_handles) - handles_before
+            if new_handles:
+                handle = new_handles.pop()
+                if self.network_policy:
+                    self._load_with_policy(handle, job.link)
+                self.tabs[job.job_id] = handle
+
+    def _load_with_policy(self, handle, link: str) -> None:
+        """Blocking rules are per tab: install them on the blank tab before it starts loading the job."""
+        self.driver.switch_to.window(handle)
+        try:
+            self.network_policy.apply(self.driver, announce=False)
+            # assigning location returns at once, the page keeps loading in the background
+            self.driver.execute_script("window.location.href = arguments[0];", link)
+        finally:
+            self.driver.switch_to.window(self.home_handle)
+
+    def activate(self, job) -> bool:
+        """Switches to the prefetched tab of `job`. Returns False when it was not prefetched."""
+        handle = self.tabs.pop(job.job_id, None)
+        if handle is None:
+            return False
+        self.driver.switch_to.window(handle)
+        self.active_handle = handle
+        return True
+
+    def release(self) -> None:
+        """Closes the tab of the job that was just processed and switches back to the results tab."""
+        if self.active_handle is None:
+            return
+        try:
+            self.driver.switch_to.window(self.active_handle)
+            self.driver.close()
+        except Exception as e:
+            print(f"⚠️ Could not close prefetched tab: {e}")
+        self.active_handle = None
+        self.driver.switch_to.window(self.home_handle)
+
+    def close_all(self) -> None:
+        """Closes every prefetched tab that was not used, e.g. when leaving a results page."""
+        self.release()
+        for handle in self.tabs.values():
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+        self.tabs.clear()
+        if self.home_handle is not None:
+            self.driver.switch_to.window(self.home_handle)
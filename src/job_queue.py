@@ -0,0 +1,99 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from src.job import Job
+
+
+class JobQueue:
+    """Persistent priority queue of discovered jobs, stored in SQLite in the output folder.
+
+    `put` blocks while `max_pending` jobs are waiting (backpressure on discovery), `get` claims
+    the highest priority pending job. Jobs claimed by a run that crashed are put back to pending
+    when the queue is opened again. A job ID is only queued once, unless its last attempt failed:
+    then discovering it again puts it back to pending.
+    """
+
+    def __init__(self, db_path: Path, max_pending: int = 50):
+        self.db_path = Path(db_path)
+        self.max_pending = max_pending
+        self.closed = False
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " job_id TEXT PRIMARY KEY, priority REAL NOT NULL, status TEXT NOT NULL,"
+                " record TEXT NOT NULL, enqueued_at REAL NOT NULL, claimed_at REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (status, priority)")
+            self._connection.execute("UPDATE jobs SET status = 'pending', claimed_at = NULL WHERE status = 'claimed'")
+            self._connection.commit()
+
+    def put(self, job: Job, priority: float = 0.0) -> bool:
+        """Queues `job`, waiting while the queue is full.
+
+        Returns False when the job was already queued (and did not fail) or the queue is closed.
+        """
+        with self._changed:
+            if self._connection.execute(
+                    "SELECT 1 FROM jobs WHERE job_id = ? AND status != 'failed'", (job.job_id,)).fetchone():
+                return False
+            while not self.closed and self._count("pending") >= self.max_pending:
+                self._changed.wait(timeout=1.0)
+            if self.closed:
+                return False
+            cursor = self._connection.execute(
+                "INSERT INTO jobs (job_id, priority, status, record, enqueued_at) VALUES (?, ?, 'pending', ?, ?)"
+                " ON CONFLICT (job_id) DO UPDATE SET priority = excluded.priority, status = 'pending',"
+                " record = excluded.record, enqueued_at = excluded.enqueued_at, claimed_at = NULL"
+                " WHERE jobs.status = 'failed'",
+                (job.job_id, priority, json.dumps(asdict(job)), time.time())
+            )
+            self._connection.commit()
+            self._changed.notify_all()
+            return cursor.rowcount == 1
+
+    def get(self, timeout: float = None):
+        """Claims the highest priority pending job. Returns None once the queue is closed and drained."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                row = self._connection.execute(
+                    "SELECT job_id, record FROM jobs WHERE status = 'pending' ORDER BY priority DESC, enqueued_at LIMIT 1"
+                ).fetchone()
+                if row:
+                    self._connection.execute(
+                        "UPDATE jobs SET status = 'claimed', claimed_at = ? WHERE job_id = ?", (time.time(), row[0])
+                    )
+                    self._connection.commit()
+                    self._changed.notify_all()
+                    return Job(**json.loads(row[1]))
+                if self.closed:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._changed.wait(timeout=1.0 if remaining is None else min(remaining, 1.0))
+
+    def mark(self, job: Job, status: str) -> None:
+        """Records the outcome of a claimed job, e.g. 'done' or 'failed'."""
+        with self._changed:
+            self._connection.execute("UPDATE jobs SET status = ? WHERE job_id = ?", (status, job.job_id))
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Signals that discovery is over: consumers stop once the pending jobs are drained and `put` no longer queues."""
+        with self._changed:
+            self.closed = True
+            self._changed.notify_all()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def _count(self, status: str) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
@@ -0,0 +1,52 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the threads of this process are serialized
+    fcntl = None
+
+_thread_locks = {}
+_thread_locks_lock = threading.Lock()
+
+
+def _thread_lock(path: Path) -> threading.Lock:
+    with _thread_locks_lock:
+        return _thread_locks.setdefault(path, threading.Lock())
+
+
+def _read(path: Path) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+@contextmanager
+def locked_json(path: Path, indent: int = None):
+    """Yields the JSON object stored at `path` and writes it back once the block completes.
+
+    An exclusive flock on `<path>.lock` is held for the whole read-modify-write, so processes
+    sharing the file (the bot and the pregeneration workers) merge their updates instead of
+    overwriting each other's with the copy they loaded. The file is replaced atomically.
+    """
+    path = Path(path).resolve()
+    with _thread_lock(path), open(path.with_name(path.name + ".lock"), 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        data = _read(path)
+        yield data
+        descriptor, partial_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".part")
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=indent)
+            os.replace(partial_path, path)
+        except BaseException:
+            os.unlink(partial_path)
+            raise
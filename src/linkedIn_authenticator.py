@@ -1,15 +1,43 @@
+import json
+import os
+import tempfile
 import time
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+import urllib.error
+import urllib.request
+from pathlib import Path
+import src.pacing as pacing
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Lightweight authenticated endpoint: 200 with a valid session, 401/403 or a redirect otherwise
+SESSION_CHECK_URL = "https://www.linkedin.com/voyager/api/me"
+SESSION_COOKIE = "li_at"
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None  # an expired session is redirected to the login page: treat the redirect as the answer
+
+
 class LinkedInAuthenticator:
     
-    def __init__(self, driver=None):
+    def __init__(self, driver=None, cookies_path: Path = None, revalidate_after_hours: float = 12):
         self.driver = driver
         self.email = ""
         self.password = ""
+        self.cookies_path = Path(cookies_path) if cookies_path else None
+        self.revalidate_after_hours = revalidate_after_hours
+
+    @classmethod
+    def from_parameters(cls, driver, parameters: dict):
+        """Keeps session cookies in the output folder unless `session.persist_cookies` is false in config.yaml."""
+        options = parameters.get('session') or {}
+        cookies_path = None
+        if options.get('persist_cookies', True):
+            cookies_path = Path(parameters['outputFileDirectory']) / "linkedin_cookies.json"
+        return cls(driver, cookies_path, options.get('revalidate_after_hours', 12))
 
     def set_secrets(self, email, password):
         self.email = email
@@ -17,29 +45,122 @@ class LinkedInAuthenticator:
 
     def start(self):
         print("Starting Chrome browser to log in to LinkedIn.")
-        self.driver.get('https://www.linkedin.com')
+        started = time.perf_counter()
+        if self.restore_session():
+            print(f"✅ LinkedIn session restored in {time.perf_counter() - started:.1f}s.")
+            return
+
+        self.driver.get('https://www.linkedin.com/login')
         self.wait_for_page_load()
         if not self.is_logged_in():
             self.handle_login()
+        self.save_cookies()
 
-        # ✅ After login, go directly to the Jobs page
-        print("🔄 Redirecting to LinkedIn Jobs Page...")
-        self.driver.get("https://www.linkedin.com/jobs")
-        time.sleep(5)  # Allow time for the page to load
+    def restore_session(self) -> bool:
+        """Reuses the browser's or the saved session without opening any page when it is valid.
 
-    def handle_login(self):
-        print("Navigating to the LinkedIn login page...")
-        self.driver.get("https://www.linkedin.com/login")
-        self.wait_for_page_load()
+        The session cookie is read and restored through the DevTools protocol, which needs no
+        page to be loaded, and always checked with a single request to a lightweight API
+        endpoint. Only when LinkedIn cannot be reached that way is a session validated less
+        than `revalidate_after_hours` ago trusted without checking the login page.
+        """
+        if self.cookies_path is None:
+            return False
+        try:
+            browser_cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except WebDriverException:
+            return False
+        saved = self._load_cookies()
+        session = self._session_cookie(browser_cookies)
+        if session is None and self._session_cookie(saved.get("cookies", [])) is not None:
+            print("🍪 Restoring saved LinkedIn session cookies...")
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": [
+                {key: value for key, value in cookie.items()
+                 if key in ("name", "value", "domain", "path", "expires", "secure", "httpOnly", "sameSite")
+                 and not (key == "expires" and value <= 0)}  # no expiry: a browser session cookie
+                for cookie in saved["cookies"]
+            ]})
+            browser_cookies = saved["cookies"]
+            session = self._session_cookie(browser_cookies)
+        if session is None:
+            return False
+
+        valid = self.validate_session(browser_cookies)
+        if valid:
+            self.save_cookies(browser_cookies)
+            return True
+        if valid is None:
+            validated_at = saved.get("validated_at", 0) if self._session_cookie(saved.get("cookies", [])) == session else 0
+            return time.time() - validated_at < self.revalidate_after_hours * 3600
+        print("🔒 Saved LinkedIn session has expired.")
+        return False
+
+    @staticmethod
+    def _session_cookie(cookies: list):
+        """Value of the unexpired LinkedIn session cookie, or None."""
+        for cookie in cookies:
+            if cookie.get("name") == SESSION_COOKIE and cookie.get("domain", "").endswith("linkedin.com"):
+                expires = cookie.get("expires", -1)
+                if expires is None or expires <= 0 or expires > time.time():  # -1: session cookie
+                    return cookie.get("value")
+        return None
+
+    @staticmethod
+    def validate_session(cookies: list):
+        """True or False from one request to LinkedIn with the given cookies, None when LinkedIn could not be reached."""
+        jar = {cookie["name"]: cookie["value"] for cookie in cookies if cookie.get("domain", "").endswith("linkedin.com")}
+        request = urllib.request.Request(SESSION_CHECK_URL, headers={
+            "Cookie": "; ".join(f"{name}={value}" for name, value in jar.items()),
+            "csrf-token": jar.get("JSESSIONID", "").strip('"'),
+            "Accept": "application/json",
+        })
+        try:
+            with urllib.request.build_opener(_NoRedirect).open(request, timeout=10) as response:
+                return response.status == 200
+        except urllib.error.HTTPError as e:
+            if e.code in (301, 302, 303, 307, 401, 403):
+                return False
+            return None
+        except (urllib.error.URLError, OSError):
+            return None
 
-        # ✅ Double-check if user is already logged in
-        if self.is_logged_in():
+    def _load_cookies(self) -> dict:
+        try:
+            with open(self.cookies_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_cookies(self, cookies: list = None) -> None:
+        """Writes the LinkedIn cookies of the browser to the output folder, readable by the user only."""
+        if self.cookies_path is None:
+            return
+        try:
+            cookies = cookies or self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except WebDriverException:
+            return
+        cookies = [cookie for cookie in cookies if cookie.get("domain", "").endswith("linkedin.com")]
+        if self._session_cookie(cookies) is None:
             return
+        self.cookies_path.parent.mkdir(parents=True, exist_ok=True)
+        # one temporary file per writer (created 0600): parallel workers may save at the same time
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cookies_path.parent,
+                                         prefix=self.cookies_path.name, suffix=".part", delete=False) as f:
+            json.dump({"validated_at": time.time(), "cookies": cookies}, f)
+        os.replace(f.name, self.cookies_path)
+
+    def handle_login(self):
+        if "/login" not in self.driver.current_url:
+            print("Navigating to the LinkedIn login page...")
+            self.driver.get("https://www.linkedin.com/login")
+            self.wait_for_page_load()
+            if self.is_logged_in():
+                return
 
         try:
             self.enter_credentials()
             self.submit_login_form()
-            time.sleep(5)  # ✅ Allow redirect time
+            pacing.pause("login_redirect")  # ✅ Allow redirect time
         except NoSuchElementException:
             print("❌ Could not log in to LinkedIn. Please check your credentials.")
 
@@ -56,7 +177,7 @@ class LinkedInAuthenticator:
         except TimeoutException:
             print("❌ Login form not found. Retrying login...")
             self.driver.refresh()  # ✅ Refresh and retry
-            time.sleep(3)
+            pacing.pause("retry")
             self.enter_credentials()  # Recursive retry
 
     def submit_login_form(self):
@@ -66,7 +187,7 @@ class LinkedInAuthenticator:
         except NoSuchElementException:
             print("❌ Login button not found. Retrying...")
             self.driver.refresh()
-            time.sleep(3)
+            pacing.pause("retry")
             self.enter_credentials()  # Try entering credentials again
 
     def handle_security_check(self):
@@ -83,15 +204,15 @@ class LinkedInAuthenticator:
             print("❌ Security check not completed. Please try again later.")
 
     def is_logged_in(self):
-        """ ✅ Improved login check """
-        self.driver.get('https://www.linkedin.com/feed')
-        self.wait_for_page_load()
-        time.sleep(3)
-
-        if "feed" in self.driver.current_url:
+        """Checks the page already open: LinkedIn sends a logged-in visitor of /login to the feed."""
+        current_url = self.driver.current_url
+        if "/feed" in current_url:
             print("✅ User is already logged in.")
             return True
+        if any(part in current_url for part in ("/login", "/checkpoint", "/authwall", "/uas/")):
+            return False
 
+        pacing.pause("login_check")
         try:
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, 'global-nav__me-photo'))
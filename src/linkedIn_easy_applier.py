@@ -3,22 +3,24 @@ import json
 import os
 import random
 import re
-import tempfile
-import time
+import threading
 import traceback
 import src.strings as strings
 from datetime import date
 from typing import List, Optional, Any, Tuple
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver import ActionChains
 import src.utils as utils
+import src.pacing as pacing
+
+# The answer store is shared by every applier (and worker) of the process
+_answers_lock = threading.Lock()
+_shared_answers = {}
+
 
 class LinkedInEasyApplier:
     def __init__(self, driver: Any, resume_dir: Optional[str], set_old_answers: List[Tuple[str, str, str]], gpt_answerer: Any, resume_generator_manager):
@@ -30,21 +32,31 @@ class LinkedInEasyApplier:
         self.gpt_answerer = gpt_answerer
         self.resume_generator_manager = resume_generator_manager
         self.all_data = self._load_questions_from_json()
+        # job_id -> {"resume": Future, "cover_letter": Future, "cover_letter_pdf": Future},
+        # see JobOrchestrator and DocumentPregenerator
+        self.document_futures = {}
+        self.tailored_resume_cache = None  # TailoredResumeCache, set by the job manager
+        self.cover_letter_service = None  # CoverLetterService, set by the job manager
+        self.job_clusters = None  # JobClusters, set by the job manager when clustering is enabled
 
     def _load_questions_from_json(self) -> List[dict]:
         output_file = 'answers.json'
         try:
-            try:
-                with open(output_file, 'r') as f:
-                    try:
-                        data = json.load(f)
-                        if not isinstance(data, list):
-                            raise ValueError("JSON file format is incorrect. Expected a list of questions.")
-                    except json.JSONDecodeError:
-                        data = []
-            except FileNotFoundError:
-                data = []
-            return data
+            with _answers_lock:
+                if output_file in _shared_answers:
+                    return _shared_answers[output_file]
+                try:
+                    with open(output_file, 'r') as f:
+                        try:
+                            data = json.load(f)
+                            if not isinstance(data, list):
+                                raise ValueError("JSON file format is incorrect. Expected a list of questions.")
+                        except json.JSONDecodeError:
+                            data = []
+                except FileNotFoundError:
+                    data = []
+                _shared_answers[output_file] = data
+                return data
         except Exception:
             tb_str = traceback.format_exc()
             raise Exception(f"Error loading questions data from JSON file: \nTraceback:\n{tb_str}")
@@ -55,44 +67,37 @@ class LinkedInEasyApplier:
             apply_button, apply_type = self._find_apply_button()
 
             if apply_button is None or apply_type is None:
-                utils.printred(f"❌ No apply button found for {job.title} at {job.company}. Skipping...")
-                return
+                raise Exception(f"No apply button found for {job.title} at {job.company}.")
 
             if apply_type == "easy_apply":
                 apply_button.click()
-                time.sleep(2)
+                pacing.pause("after_click")
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, 'jobs-easy-apply-content'))
+                )
 
-                # ✅ Check if a form is loaded (LinkedIn sometimes loads multiple steps)
+                # ✅ Fill every step (uploads use the documents prepared in the background), then submit
                 try:
-                    next_button = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Next')]"))
-                    )
-                    next_button.click()
-                    time.sleep(2)
-                except:
-                    pass  # If no "Next" button, continue
-
-                # ✅ Submit Application
-                submit_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Submit application')]"))
-                )
-                submit_button.click()
+                    self._fill_application_form(job)
+                except Exception:
+                    self._discard_application()
+                    raise
 
                 utils.printyellow(f"✅ Successfully applied to {job.title} at {job.company} via Easy Apply.")
 
-            elif apply_type == "external_apply":
-                utils.printyellow(f"🌍 Redirecting to external application site for {job.title} at {job.company}...")
-                self._handle_external_form(job)
-
             else:
-                utils.printred(f"❌ No valid application type detected for {job.title} at {job.company}")
+                raise Exception(f"No Easy Apply button for {job.title} at {job.company}, only an external application.")
 
+        # The caller records the job as failed, so it is retried on a later run
         except NoSuchElementException:
             utils.printred(f"❌ Apply button not found for {job.title} at {job.company}")
+            raise
         except TimeoutException:
             utils.printred(f"❌ Timed out waiting for Apply button for {job.title} at {job.company}")
+            raise
         except Exception as e:
             utils.printred(f"❌ Unexpected error while applying: {e}")
+            raise
 
     def _handle_standard_apply(self, job):
         print(f"🌍 Applying on external site for: {job.title} at {job.company}")
@@ -102,7 +107,7 @@ class LinkedInEasyApplier:
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
 
-        ai_cover_letter = self.gpt_answerer.generate_cover_letter(job)
+        ai_cover_letter = self.cover_letter_service.text(job)
         ai_resume = self.gpt_answerer.generate_resume(job)
 
         try:
@@ -113,10 +118,10 @@ class LinkedInEasyApplier:
         except TimeoutException:
             print(f"⚠️ Apply button not found. Retrying application for {job.title}...")
             self.driver.refresh()
-            time.sleep(3)
+            pacing.pause("retry")
             return self._handle_standard_apply(job)  # Retry logic
 
-        time.sleep(2)
+        pacing.pause("after_click")
 
         if "Easy Apply" in apply_button.text:
             self._handle_easy_apply(job)
@@ -125,9 +130,13 @@ class LinkedInEasyApplier:
 
 
     def _find_apply_button(self) -> Tuple[Optional[WebElement], Optional[str]]:
-        attempt = 0
-        while attempt < 2:
-            self._scroll_page()
+        # The job page is already open: look for the button right away and only fall back
+        # to refreshing and scrolling the whole page when it is not rendered yet.
+        for attempt in range(2):
+            if attempt:
+                self.driver.refresh()
+                pacing.pause("retry")
+                self._scroll_page()
             try:
                 buttons = WebDriverWait(self.driver, 10).until(
                     EC.presence_of_all_elements_located(
@@ -136,7 +145,7 @@ class LinkedInEasyApplier:
                 )
             except TimeoutException:
                 utils.printred("❌ No Apply button found on the page.")
-                return None, None
+                continue
 
             for index, button in enumerate(buttons):
                 try:
@@ -149,92 +158,36 @@ class LinkedInEasyApplier:
                         return button, "external_apply"
                 except Exception as e:
                     utils.printred(f"⚠️ Error while processing Apply button: {e}")
-            attempt += 1
-            self.driver.refresh()
-            time.sleep(3)
         return None, None  # If nothing is found after 2 attempts
-    
-    def _get_job_description(self) -> str:
-        try:
-            see_more_button = self.driver.find_element(By.XPATH, '//button[@aria-label="Click to see more description"]')
-            actions = ActionChains(self.driver)
-            actions.move_to_element(see_more_button).click().perform()
-            time.sleep(2)
-            description = self.driver.find_element(By.CLASS_NAME, 'jobs-description-content__text').text
-            
-            if "remote" in description.lower():
-                job_type = "Remote"
-            elif "hybrid" in description.lower():
-                job_type = "Hybrid"
-            else:
-                job_type = "On-Site"
-            print(f"Job Type Detected: {job_type}")
-
-            return description
-        except NoSuchElementException:
-            print("Error: 'See more' button not found.")
-        except Exception:
-            print("Error getting Job description.")
-
-    def _get_job_recruiter(self):
-        try:
-            hiring_team_section = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, '//h2[text()="Meet the hiring team"]'))
-            )
-            recruiter_element = hiring_team_section.find_element(By.XPATH, './/following::a[contains(@href, "linkedin.com/in/")]')
-            recruiter_link = recruiter_element.get_attribute('href')
-            return recruiter_link
-        except Exception as e:
-            return ""
 
     def _scroll_page(self) -> None:
         scrollable_element = self.driver.find_element(By.TAG_NAME, 'html')
         utils.scroll_slow(self.driver, scrollable_element, step=300, reverse=False)
         utils.scroll_slow(self.driver, scrollable_element, step=300, reverse=True)
 
-    def _fill_application_form(self, job):
-        if "external_apply" in self.driver.page_source.lower():
-            print("Redirected to external site. Attempting AI-powered form filling.")
-            self._handle_external_application(job)
-        else:
-            while True:
-                self.fill_up(job)
-                if self._next_or_submit():
-                    break
-                
+    def _fill_application_form(self, job, max_steps: int = 10):
+        """Fills the Easy Apply modal one step at a time until the application is submitted."""
+        for _ in range(max_steps):
+            self.fill_up(job)
+            if self._next_or_submit():
+                return
+        raise Exception(f"Easy Apply form not submitted after {max_steps} steps.")
+
     def _next_or_submit(self):
         next_button = self.driver.find_element(By.CLASS_NAME, "artdeco-button--primary")
         button_text = next_button.text.lower()
 
         if 'submit application' in button_text:
             self._unfollow_company()
-            time.sleep(random.uniform(1.5, 2.5))
+            pacing.pause("before_submit")
             print("✅ Submitting application...")
             next_button.click()
-            time.sleep(random.uniform(1.5, 2.5))
+            pacing.pause("after_submit")
             return True
 
         utils.printyellow("⚠️ Moving to the next step in Easy Apply...")
         next_button.click()
-        time.sleep(random.uniform(3.0, 5.0))
-        self._check_for_errors()
-
-    def _next_or_submit(self):
-        next_button = self.driver.find_element(By.CLASS_NAME, "artdeco-button--primary")
-        button_text = next_button.text.lower()
-        if 'submit application' in button_text:
-            self._unfollow_company()
-            time.sleep(random.uniform(1.5, 2.5))
-            print("Submitting application...")
-            next_button.click()
-            print("Application submitted successfully.")
-            time.sleep(random.uniform(1.5, 2.5))
-            return True
-        time.sleep(random.uniform(1.5, 2.5))
-        print("Submitting application...")
-        next_button.click()
-        print("Application submitted successfully.")
-        time.sleep(random.uniform(3.0, 5.0))
+        pacing.pause("next_step")
         self._check_for_errors()
 
     def _unfollow_company(self) -> None:
@@ -256,29 +209,24 @@ class LinkedInEasyApplier:
         try:
             print("Discarding incomplete application...")
             self.driver.find_element(By.CLASS_NAME, 'artdeco-modal__dismiss').click()
-            time.sleep(random.uniform(3, 5))
+            pacing.pause("discard")
             self.driver.find_elements(By.CLASS_NAME, 'artdeco-modal__confirm-dialog-btn')[0].click()
             print("Application discarded.")
         except Exception as e:
             print(f"Error discarding application: {str(e)}")
 
     def fill_up(self, job) -> None:
+        """Fills the current step: its uploads, then each of its questions once."""
         easy_apply_content = self.driver.find_element(By.CLASS_NAME, 'jobs-easy-apply-content')
-        pb4_elements = easy_apply_content.find_elements(By.CLASS_NAME, 'pb4')
-        for element in pb4_elements:
-            self._process_form_element(element, job)
-        
-    def _process_form_element(self, element: WebElement, job) -> None:
-        if self._is_upload_field(element):
-            self._handle_upload_fields(element, job)
-        else:
-            self._fill_additional_questions()
+        if self._has_upload_field(easy_apply_content):
+            self._handle_upload_fields(easy_apply_content, job)
+        self._fill_additional_questions(easy_apply_content)
 
-    def _is_upload_field(self, element: WebElement) -> bool:
+    def _has_upload_field(self, element: WebElement) -> bool:
         return bool(element.find_elements(By.XPATH, ".//input[@type='file']"))
 
     def _handle_upload_fields(self, element, job):
-        file_upload_elements = self.driver.find_elements(By.XPATH, "//input[@type='file']")
+        file_upload_elements = element.find_elements(By.XPATH, ".//input[@type='file']")
         for element in file_upload_elements:
             parent = element.find_element(By.XPATH, "..")
             self.driver.execute_script("arguments[0].classList.remove('hidden')", element)
@@ -286,43 +234,63 @@ class LinkedInEasyApplier:
             field_label = parent.text.lower()
             if 'resume' in field_label:
                 print("📂 Uploading resume...")
-                element.send_keys(self.resume_path)
+                if self.resume_path:
+                    element.send_keys(self.resume_path)
+                else:
+                    self._create_and_upload_resume(element, job)
             elif 'cover' in field_label:
                 print("📄 Uploading cover letter...")
-                self._create_and_upload_cover_letter(element)
+                self._create_and_upload_cover_letter(element, job)
 
-    def _create_and_upload_resume(self, element, job):
+    def _prepared_document(self, job, kind: str, generate):
+        """Returns the document prepared in the background for `job`, or generates it inline."""
+        future = self.document_futures.get(job.job_id, {}).get(kind)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                utils.printred(f"⚠️ Background {kind.replace('_', ' ')} for {job.title} failed ({e}), generating it now...")
+        return generate(job)
+
+    def generate_tailored_resume(self, job) -> str:
+        """Returns the path of the resume tailored to the job description, rendering it into generated_cv/ if needed."""
+        render = lambda description: self.resume_generator_manager.pdf_base64(job_description_text=description)
+        # jobs of a cluster share the resume rendered from its representative description
+        description = self.job_clusters.representative_description(job) if self.job_clusters else job.description
+        if self.tailored_resume_cache is not None:
+            return self.tailored_resume_cache.get_or_create(description, render)
         folder_path = 'generated_cv'
         os.makedirs(folder_path, exist_ok=True)
+        file_path_pdf = os.path.join(folder_path, f"CV_{job.job_id or random.randint(0, 9999)}.pdf")
+        with open(file_path_pdf, "wb") as f:
+            f.write(base64.b64decode(render(job.description)))
+        return os.path.abspath(file_path_pdf)
+
+    def generate_cover_letter_text(self, job) -> str:
+        return self.cover_letter_service.text(job)
+
+    def _create_and_upload_resume(self, element, job):
         try:
-            file_path_pdf = os.path.join(folder_path, f"CV_{random.randint(0, 9999)}.pdf")
-            with open(file_path_pdf, "xb") as f:
-                f.write(base64.b64decode(self.resume_generator_manager.pdf_base64(job_description_text=job.description)))
-            element.send_keys(os.path.abspath(file_path_pdf))
-            job.pdf_path = os.path.abspath(file_path_pdf)
-            time.sleep(2)
+            file_path_pdf = self._prepared_document(job, "resume", self.generate_tailored_resume)
+            element.send_keys(file_path_pdf)
+            job.pdf_path = file_path_pdf
+            pacing.pause("upload")
         except Exception:
             tb_str = traceback.format_exc()
             raise Exception(f"Upload failed: \nTraceback:\n{tb_str}")
 
-    def _create_and_upload_cover_letter(self, element: WebElement) -> None:
-        cover_letter = self.gpt_answerer.answer_question_textual_wide_range("Write a cover letter")
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf_file:
-            letter_path = temp_pdf_file.name
-            c = canvas.Canvas(letter_path, pagesize=letter)
-            _, height = letter
-            text_object = c.beginText(100, height - 100)
-            text_object.setFont("Helvetica", 12)
-            text_object.textLines(cover_letter)
-            c.drawText(text_object)
-            c.save()
-            element.send_keys(letter_path)
-
-    def _fill_additional_questions(self) -> None:
-        form_sections = self.driver.find_elements(By.CLASS_NAME, 'jobs-easy-apply-form-section__grouping')
+    def generate_cover_letter_pdf(self, job) -> str:
+        cover_letter = self._prepared_document(job, "cover_letter", self.generate_cover_letter_text)
+        return self.cover_letter_service.pdf(job, cover_letter)
+
+    def _create_and_upload_cover_letter(self, element: WebElement, job) -> None:
+        letter_path = self._prepared_document(job, "cover_letter_pdf", self.generate_cover_letter_pdf)
+        element.send_keys(letter_path)
+
+    def _fill_additional_questions(self, element: WebElement) -> None:
+        form_sections = element.find_elements(By.CLASS_NAME, 'jobs-easy-apply-form-section__grouping')
         for section in form_sections:
             self._process_form_section(section)
-            
 
     def _process_form_section(self, section: WebElement) -> None:
         if self._handle_terms_of_service(section):
@@ -344,8 +312,7 @@ class LinkedInEasyApplier:
         return False
 
     def _find_and_handle_radio_question(self, section: WebElement) -> bool:
-        question = section.find_element(By.CLASS_NAME, 'jobs-easy-apply-form-element')
-        radios = question.find_elements(By.CLASS_NAME, 'fb-text-selectable__option')
+        radios = section.find_elements(By.CLASS_NAME, 'fb-text-selectable__option')
         if radios:
             question_text = section.text.lower()
             options = [radio.text.lower() for radio in radios]
@@ -365,20 +332,19 @@ class LinkedInEasyApplier:
         text_fields = section.find_elements(By.TAG_NAME, 'input') + section.find_elements(By.TAG_NAME, 'textarea')
         if text_fields:
             text_field = text_fields[0]
-            question_text = section.find_element(By.TAG_NAME, 'label').text.lower()
-            is_numeric = self._is_numeric_field(text_field)
-            if is_numeric:
-                question_type = 'numeric'
-                answer = self.gpt_answerer.answer_question_numeric(question_text)
-            else:
-                question_type = 'textbox'
-                answer = self.gpt_answerer.answer_question_textual_wide_range(question_text)
-            existing_answer = None
+            if self._is_prefilled(text_field):  # e.g. the contact details LinkedIn fills from the profile
+                return True
+            labels = section.find_elements(By.TAG_NAME, 'label')
+            question_text = (labels[0] if labels else section).text.lower()
+            question_type = 'numeric' if self._is_numeric_field(text_field) else 'textbox'
             for item in self.all_data:
                 if 'cover' not in item['question'] and item['question'] == self._sanitize_text(question_text) and item['type'] == question_type:
-                    existing_answer = item
-                    self._enter_text(text_field, existing_answer['answer'])
+                    self._enter_text(text_field, item['answer'])
                     return True
+            if question_type == 'numeric':
+                answer = str(self.gpt_answerer.answer_question_numeric(question_text))
+            else:
+                answer = self.gpt_answerer.answer_question_textual_wide_range(question_text)
             self._save_questions_to_json({'type': question_type, 'question': question_text, 'answer': answer})
             self._enter_text(text_field, answer)
             return True
@@ -388,17 +354,15 @@ class LinkedInEasyApplier:
         date_fields = section.find_elements(By.CLASS_NAME, 'artdeco-datepicker__input ')
         if date_fields:
             date_field = date_fields[0]
+            if self._is_prefilled(date_field):
+                return True
             question_text = section.text.lower()
-            answer_date = self.gpt_answerer.answer_question_date()
-            answer_text = answer_date.strftime("%Y-%m-%d")
-
-            existing_answer = None
             for item in self.all_data:
                 if  self._sanitize_text(question_text) in item['question'] and item['type'] == 'date':
-                    existing_answer = item
-                    self._enter_text(date_field, existing_answer['answer'])
+                    self._enter_text(date_field, item['answer'])
                     return True
 
+            answer_text = self.gpt_answerer.answer_question_date(question_text).strftime("%Y-%m-%d")
             self._save_questions_to_json({'type': 'date', 'question': question_text, 'answer': answer_text})
             self._enter_text(date_field, answer_text)
             return True
@@ -425,6 +389,9 @@ class LinkedInEasyApplier:
         except Exception:
             return False
 
+    def _is_prefilled(self, field: WebElement) -> bool:
+        return bool((field.get_attribute('value') or '').strip())
+
     def _is_numeric_field(self, field: WebElement) -> bool:
         field_type = field.get_attribute('type').lower()
         if 'numeric' in field_type:
@@ -451,19 +418,21 @@ class LinkedInEasyApplier:
         output_file = 'answers.json'
         question_data['question'] = self._sanitize_text(question_data['question'])
         try:
-            try:
-                with open(output_file, 'r') as f:
-                    try:
-                        data = json.load(f)
-                        if not isinstance(data, list):
-                            raise ValueError("JSON file format is incorrect. Expected a list of questions.")
-                    except json.JSONDecodeError:
-                        data = []
-            except FileNotFoundError:
-                data = []
-            data.append(question_data)
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=4)
+            with _answers_lock:
+                try:
+                    with open(output_file, 'r') as f:
+                        try:
+                            data = json.load(f)
+                            if not isinstance(data, list):
+                                raise ValueError("JSON file format is incorrect. Expected a list of questions.")
+                        except json.JSONDecodeError:
+                            data = []
+                except FileNotFoundError:
+                    data = []
+                data.append(question_data)
+                with open(output_file, 'w') as f:
+                    json.dump(data, f, indent=4)
+                self.all_data.append(question_data)
         except Exception:
             tb_str = traceback.format_exc()
             raise Exception(f"Error saving questions data to JSON file: \nTraceback:\n{tb_str}")
@@ -1,8 +1,6 @@
 import os
 import random
-import time
 import traceback
-from itertools import product
 from pathlib import Path
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
@@ -12,9 +10,28 @@ from src.gpt import GPTAnswerer
 import src.strings as strings
 from src.job_application_profile import PersonalInformation, JobApplicationProfile
 import src.utils as utils
-from src.job import Job
+import src.pacing as pacing
+from src.job import Job, job_id_from_link
 from src.linkedIn_easy_applier import LinkedInEasyApplier
+from src.job_list_loader import JobListLoader
+from src.job_details import JobDetailsFetcher
+from src.job_prefetcher import JobPrefetcher
+from src.network_policy import NetworkPolicy
+from src.orchestrator import JobOrchestrator
+from src.search_scheduler import SearchScheduler
+from src.resume_cache import TailoredResumeCache
+from src.cover_letter import CoverLetterService
+from src.job_clusters import JobClusters
+from src.fit_scorer import FitScorer
+from src.blacklist import JobBlacklists
+from src.description_filter import DescriptionFilter
+from src.job_attributes import PreferenceFilter, extract_job_attributes
+from src.run_config import RunConfig
 import json
+import threading
+
+_ledger_lock = threading.Lock()
+_seen_jobs_lock = threading.Lock()  # workers of a pool share one seen-jobs index
 
 
 class EnvironmentKeys:
@@ -38,18 +55,33 @@ class LinkedInJobManager:
         self.resume_generator_manager = resume_generator_manager  # ✅ Store resume generator
         self.set_old_answers = set()
         self.easy_applier_component = None
+        self.job_list_loader = JobListLoader(driver)
+        self.job_details_fetcher = JobDetailsFetcher(driver)
 
     def set_parameters(self, parameters):
-        self.company_blacklist = parameters.get('companyBlacklist', []) or []
-        self.title_blacklist = parameters.get('titleBlacklist', []) or []
-        self.positions = parameters.get('positions', [])
-        self.locations = parameters.get('locations', [])
-        self.base_search_url = self.get_base_search_url(parameters)
-        self.seen_jobs = []
-        resume_path = parameters.get('uploads', {}).get('resume', None)
-        self.resume_path = Path(resume_path) if resume_path and Path(resume_path).exists() else None
-        self.output_file_directory = Path(parameters['outputFileDirectory'])
+        self.config = RunConfig.compile(parameters)
+        self.blacklists = JobBlacklists.from_parameters(parameters)
+        self.resume_path = self.config.resume_path
+        self.output_file_directory = self.config.output_directory
+        self.seen_jobs = self._load_seen_jobs()
         self.env_config = EnvironmentKeys()
+        pacing.configure_from_parameters(parameters)
+        self.job_prefetcher = JobPrefetcher(self.driver, max_tabs=parameters.get('prefetch_tabs', 2))
+        self.job_details_fetcher.prefetcher = self.job_prefetcher
+        self.network_policy = NetworkPolicy.from_parameters(parameters)
+        if self.network_policy:
+            self.network_policy.apply(self.driver)
+        self.job_prefetcher.network_policy = self.network_policy
+        self.orchestrator = JobOrchestrator.from_parameters(self, parameters)
+        self.search_scheduler = SearchScheduler.from_parameters(parameters)
+        self.tailored_resume_cache = TailoredResumeCache.from_parameters(parameters, self.resume_generator_manager)
+        self.cover_letter_service = CoverLetterService.from_parameters(self.gpt_answerer, parameters)
+        self.job_clusters = JobClusters.from_parameters(parameters)
+        self.fit_scorer = FitScorer.from_parameters(parameters)
+        self.description_filter = DescriptionFilter.from_parameters(
+            parameters, disabled=self.env_config.disable_description_filter
+        )
+        self.preference_filter = PreferenceFilter.from_parameters(parameters, self.job_application_profile)
 
     def set_gpt_answerer(self, gpt_answerer):
         self.gpt_answerer = gpt_answerer
@@ -58,31 +90,59 @@ class LinkedInJobManager:
         self.resume_generator_manager = resume_generator_manager
 
     def start_applying(self):
-        self.easy_applier_component = LinkedInEasyApplier(
-            self.driver, self.resume_path, self.set_old_answers, self.gpt_answerer, self.resume_generator_manager
-        )
-        searches = list(product(self.positions, self.locations))
-        random.shuffle(searches)
-
+        searches = self.search_scheduler.order(self.config.searches)
+        self.run_searches(searches)
+        self.report_run()
+        self.report_network()
+
+    def report_run(self):
+        """Prints the run-wide statistics; the components are shared by every job manager of the run."""
+        utils.printyellow(f"⏱️ {pacing.get_policy().report()}")
+        utils.printyellow(f"🤖 {self.gpt_answerer.single_flight.report()}")
+        utils.printyellow(f"🤖 {self.gpt_answerer.rate_limiter.report()}")
+        if not self.resume_path:
+            utils.printyellow(f"📄 {self.tailored_resume_cache.report()}")
+        utils.printyellow(f"✉️ {self.cover_letter_service.report()}")
+        if self.job_clusters:
+            utils.printyellow(f"🧩 {self.job_clusters.report()}")
+        if self.fit_scorer:
+            utils.printyellow(f"🎯 {self.fit_scorer.report()}")
+        if self.description_filter:
+            utils.printyellow(f"🔎 {self.description_filter.report()}")
+        if self.preference_filter:
+            utils.printyellow(f"🧭 {self.preference_filter.report()}")
+
+    def run_searches(self, searches):
+        """Runs (position, location) searches from any iterable, e.g. a queue shared by several workers."""
         for position, location in searches:
-            location_url = "&location=" + location
-            job_page_number = 1
-            utils.printyellow(f"🚀 Starting the search for {position} in {location}.")
+            self.run_search(position, location)
 
-            try:
-                while True:
-                    utils.printyellow(f"🔍 Going to job page {job_page_number}")
-                    self.next_job_page(position, location_url, job_page_number)
-                    time.sleep(random.uniform(1.5, 3.5))
-                    utils.printyellow("📝 Starting the application process for this page...")
-                    self.apply_jobs()
-                    utils.printyellow("✅ Applying to jobs on this page has been completed!")
-                    
-                    job_page_number += 1
-                    time.sleep(random.randint(10, 30))
-            except Exception as e:
-                print(f"⚠️ Error processing jobs: {e}")
-                continue
+    def run_search(self, position, location):
+        job_page_number = 1
+        utils.printyellow(f"🚀 Starting the search for {position} in {location}.")
+
+        try:
+            while True:
+                utils.printyellow(f"🔍 Going to job page {job_page_number}")
+                self.next_job_page(position, location, job_page_number)
+                self._record_network(f"search:{position}:{location}:{job_page_number}")
+                pacing.pause("page_load")
+                job_list = self.extract_page_jobs()
+                candidates = self.filter_jobs(job_list)
+                utils.printyellow("📝 Starting the application process for this page...")
+                self.apply_jobs(candidates)
+                utils.printyellow("✅ Applying to jobs on this page has been completed!")
+
+                if not self.search_scheduler.record_page(position, location, job_page_number, job_list, candidates):
+                    break
+                job_page_number += 1
+                pacing.pause("between_pages")
+        except Exception as e:
+            print(f"⚠️ Error processing jobs: {e}")
+
+    def report_network(self):
+        if self.network_policy:
+            utils.printyellow(f"📶 Network: {self.network_policy.report()}")
 
     def extract_job_information_from_tile(self, job_element):
         """Extracts job information from a LinkedIn job tile using the updated HTML structure."""
@@ -115,89 +175,144 @@ class LinkedInJobManager:
         return None, None, None, None, None
 
 
-    def apply_jobs(self):
+    def apply_jobs(self, candidates):
         try:
-            # ✅ Check if "No jobs found" banner appears (skip page if true)
-            try:
-                no_jobs_element = self.driver.find_element(By.CLASS_NAME, 'jobs-search-two-pane__no-results-banner--expand')
-                if 'No matching jobs found' in no_jobs_element.text.lower() or 'unfortunately' in self.driver.page_source.lower():
-                    print("ℹ️ No jobs found on this page. Moving to next...")
-                    return  
-            except NoSuchElementException:
-                pass  
-
-            # ✅ Scroll **incrementally** (mimic human behavior)
-            for _ in range(random.randint(3, 5)):  
-                self.driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
-                time.sleep(random.uniform(0.7, 1.3))  
-
-            # ✅ Wait for job list container **before scrolling further**
-            try:
-                job_list_container = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobs-search__results-list"))
-                )   
-                print(f"✅ DEBUG: Job list container found!")
-            except TimeoutException:
-                print("❌ ERROR: Job list container did not load in time. Skipping...")
+            if self.orchestrator:
+                self.orchestrator.apply_all(candidates)
                 return
+            for index, job in enumerate(candidates):
+                # Load the upcoming job pages in background tabs while this one is processed
+                self.job_prefetcher.prefetch(candidates[index:])
+                try:
+                    self.apply_to_job(job)
+                finally:
+                    self.job_prefetcher.release()
+        except Exception as e:
+            print(f"❌ Unexpected error in apply_jobs(): {e}")
+        finally:
+            self.job_prefetcher.close_all()
 
-            # ✅ Perform **incremental scrolling inside** job list container
-            utils.scroll_slow(self.driver, job_list_container, step=random.randint(200, 400))
-            time.sleep(random.uniform(0.8, 1.2))  
-            utils.scroll_slow(self.driver, job_list_container, step=random.randint(200, 400), reverse=True)
-            time.sleep(random.uniform(0.5, 1.0))  
+    def extract_page_jobs(self):
+        """Loads the tiles of the current results page and returns them as Job objects."""
+        # ✅ Check if "No jobs found" banner appears (skip page if true)
+        try:
+            no_jobs_element = self.driver.find_element(By.CLASS_NAME, 'jobs-search-two-pane__no-results-banner--expand')
+            if 'No matching jobs found' in no_jobs_element.text.lower() or 'unfortunately' in self.driver.page_source.lower():
+                print("ℹ️ No jobs found on this page. Moving to next...")
+                return []
+        except NoSuchElementException:
+            pass  
 
-            # ✅ Wait for job elements **after scrolling**
-            try:
-                job_list_elements = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.job-card-container"))
-                )
-            except TimeoutException:
-                print("❌ ERROR: Job listings did not load properly. Skipping this page...")
-                return
+        # ✅ Wait for job list container **before scrolling**
+        try:
+            job_list_container = WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobs-search__results-list"))
+            )   
+            print(f"✅ DEBUG: Job list container found!")
+        except TimeoutException:
+            print("❌ ERROR: Job list container did not load in time. Skipping...")
+            return []
 
-            if not job_list_elements:
-                print("⚠️ No job listings found on this page. Skipping...")
-                print("📄 DEBUG: Page Source Dump")
-                print(self.driver.page_source)
-                return
+        # ✅ Scroll only until the tiles we are going to use are rendered (limit to 10-15 jobs per page)
+        jobs_per_page = random.randint(10, 15)
+        job_list_elements = self.job_list_loader.load(job_list_container, jobs_per_page)
 
-            # ✅ Extract job details (limit to 10-15 jobs per page)
-            job_list_elements = job_list_elements[:random.randint(10, 15)]  
-            
-            job_list = [
-                Job(*job_info) for job_info in 
-                (self.extract_job_information_from_tile(job_element) for job_element in job_list_elements)
-                if all(job_info) and job_info[4] is not None  
-            ]
-
-            if not job_list:
-                print("⚠️ No valid jobs extracted. Skipping...")
-                return
+        if not job_list_elements:
+            print("⚠️ No job listings found on this page. Skipping...")
+            print("📄 DEBUG: Page Source Dump")
+            print(self.driver.page_source)
+            return []
 
-            for job in job_list:
-                print(f"🔍 Found Job: {job.title} at {job.company} [{job.apply_method}]")  
+        job_list_elements = job_list_elements[:jobs_per_page]
+        
+        job_list = [
+            Job(*job_info) for job_info in 
+            (self.extract_job_information_from_tile(job_element) for job_element in job_list_elements)
+            if all(job_info) and job_info[4] is not None  
+        ]
+
+        if not job_list:
+            print("⚠️ No valid jobs extracted. Skipping...")
+        return job_list
+
+    def filter_jobs(self, job_list):
+        """Stage 1: cheap tile-level filters, no navigation needed. Returns the jobs worth opening."""
+        candidates = []
+        for job in job_list:
+            print(f"🔍 Found Job: {job.title} at {job.company} [{job.apply_method}]")  
+
+            with _seen_jobs_lock:
+                blacklisted = self.is_blacklisted(job.title, job.company, job.link, job.location)
+                if not blacklisted:
+                    self.seen_jobs.add(job.job_id)
+            if blacklisted:
+                utils.printyellow(f"🚫 Blacklisted {job.title} at {job.company}, skipping...")
+                self.write_to_file(job, "skipped")
+                continue
+            candidates.append(job)
 
-                if self.is_blacklisted(job.title, job.company, job.link):
-                    utils.printyellow(f"🚫 Blacklisted {job.title} at {job.company}, skipping...")
+        if self.fit_scorer:
+            kept = self.fit_scorer.filter(candidates)
+            for job in candidates:
+                if job not in kept:
                     self.write_to_file(job, "skipped")
-                    continue
+            candidates = kept
+        return candidates
 
-                try:
-                    if job.apply_method == "Easy Apply":
-                        self.easy_applier_component.job_apply(job)
-                    elif job.apply_method == "Standard":
-                        self.handle_standard_application(job)
-
-                    # ✅ Ensures both Easy Apply & Standard Apply jobs are logged as "success"
-                    self.write_to_file(job, "success")
-
-                except Exception as e:
-                    utils.printred(traceback.format_exc())
-                    self.write_to_file(job, "failed")
-                    continue
+    def get_easy_applier(self):
+        if self.easy_applier_component is None:
+            self.easy_applier_component = LinkedInEasyApplier(
+                self.driver, self.resume_path, self.set_old_answers, self.gpt_answerer, self.resume_generator_manager
+            )
+            self.easy_applier_component.tailored_resume_cache = self.tailored_resume_cache
+            self.easy_applier_component.cover_letter_service = self.cover_letter_service
+            self.easy_applier_component.job_clusters = self.job_clusters
+        return self.easy_applier_component
+
+    def fetch_job_details(self, job):
+        """Fills the description, recruiter and structured fields of `job` and assigns it to its cluster."""
+        self.job_details_fetcher.fetch(job)
+        extract_job_attributes(job)
+        print(f"📋 {job.work_mode or 'Unknown work mode'}, {job.seniority or 'unknown seniority'}"
+              + (f", {job.salary_min:,.0f}-{job.salary_max:,.0f} {job.salary_currency}/year" if job.salary_currency else ""))
+        if self.job_clusters:
+            self.job_clusters.assign(job)
+
+    def passes_description_checks(self, job):
+        """Keyword rules, profile preferences and fit score on the fetched description, before any LLM or form work."""
+        if not job.description:
+            return True
+        if self.description_filter and not self.description_filter.check(job):
+            return False
+        if self.preference_filter and not self.preference_filter.check(job):
+            return False
+        return not self.fit_scorer or self.fit_scorer.check(job)
+
+    def apply_to_job(self, job):
+        """Returns True when the application went through and was recorded as a success."""
+        self.get_easy_applier()
+        try:
+            # Stage 2: open the job page and fetch its details only for survivors
+            self.fetch_job_details(job)
+            self._record_network(f"job:{job.job_id}")
+            if not self.passes_description_checks(job):
+                self.write_to_file(job, "skipped")
+                return False
+
+            # Stage 3: scroll, click and LLM work on jobs that can still be applied to
+            self.job_details_fetcher.open(job)
+            if job.apply_method == "Easy Apply":
+                self.easy_applier_component.job_apply(job)
+            elif job.apply_method == "Standard":
+                self.handle_standard_application(job)
+
+            # ✅ Ensures both Easy Apply & Standard Apply jobs are logged as "success"
+            self.write_to_file(job, "success")
+            return True
         except Exception as e:
-            print(f"❌ Unexpected error in apply_jobs(): {e}")
+            utils.printred(traceback.format_exc())
+            self.write_to_file(job, "failed")
+            return False
 
     def _handle_standard_apply(self, job, resume_path, cover_letter_text):
         try:
@@ -246,7 +361,7 @@ class LinkedInJobManager:
                 print(f"✅ Successfully applied to {job.title} at {job.company} via standard apply.")
             except TimeoutException:
                 print("⚠️ Could not find submit button. Retrying...")
-                time.sleep(3)
+                pacing.pause("retry")
                 try:
                     submit_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Submit') or contains(text(), 'Apply')]")
                     submit_button.click()
@@ -264,7 +379,7 @@ class LinkedInJobManager:
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
 
-        ai_cover_letter = self.gpt_answerer.generate_cover_letter(job)
+        ai_cover_letter = self.cover_letter_service.text(job)
         ai_resume = self.gpt_answerer.generate_resume(job)
 
         try:
@@ -281,7 +396,7 @@ class LinkedInJobManager:
             utils.printred(f"❌ Apply button not found for {job.title} at {job.company}: {e}")
             return
 
-        time.sleep(2)
+        pacing.pause("after_click")
 
         # Check if Easy Apply or Standard Apply is being used
         if "easy apply" in apply_text:
@@ -319,74 +434,58 @@ class LinkedInJobManager:
             "pdf_path": Path(job.pdf_path).resolve().as_uri(),
         }
         file_path = self.output_file_directory / f"{file_name}.json"
-        if not file_path.exists():
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump([data], f, indent=4)
-        else:
-            with open(file_path, 'r+', encoding='utf-8') as f:
-                try:
-                    existing_data = json.load(f)
-                except json.JSONDecodeError:
-                    existing_data = []
-                existing_data.append(data)
-                f.seek(0)
-                json.dump(existing_data, f, indent=4)
-                f.truncate()
-
-    def get_base_search_url(self, parameters):
-        url_parts = []
-        
-        if parameters['remote']:
-            url_parts.append("f_CF=f_WRA")
-        if parameters['onsite']:
-            url_parts.append("f_CF=f_ON")
-
-        experience_levels = [str(i+1) for i, (level, v) in enumerate(parameters.get('experienceLevel', {}).items()) if v]
-        if experience_levels:
-            url_parts.append(f"f_E={','.join(experience_levels)}")
-
-        url_parts.append(f"distance={parameters['distance']}")
-
-        job_types = [key[0].upper() for key, value in parameters.get('jobTypes', {}).items() if value]
-        if job_types:
-            url_parts.append(f"f_JT={','.join(job_types)}")
-
-        # ✅ Add Date Filtering Logic
-        date_filter_map = {
-            "all time": None,
-            "month": "f_TPR=r2592000",
-            "week": "f_TPR=r604800",
-            "24 hours": "f_TPR=r86400"  # ✅ This is the filter for last 24 hours
-        }
-        
-        for key, value in parameters.get('date', {}).items():
-            if value and key in date_filter_map:
-                date_filter = date_filter_map[key]
-                if date_filter:
-                    url_parts.append(date_filter)
-                break  # Only apply the first matched filter
-
-        return f"?{'&'.join(url_parts)}"
+        with _ledger_lock:  # the results ledger is shared by every worker of the process
+            if not file_path.exists():
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump([data], f, indent=4)
+            else:
+                with open(file_path, 'r+', encoding='utf-8') as f:
+                    try:
+                        existing_data = json.load(f)
+                    except json.JSONDecodeError:
+                        existing_data = []
+                    existing_data.append(data)
+                    f.seek(0)
+                    json.dump(existing_data, f, indent=4)
+                    f.truncate()
+
+    def _record_network(self, label):
+        if self.network_policy:
+            page = self.network_policy.record_page(self.driver, label)
+            print(f"📶 {label}: {page['requests']} requests, {page['bytes'] / 1024:.0f} KB, {page['blocked']} blocked")
+
+    def _load_seen_jobs(self):
+        """Builds the seen index from the job IDs already recorded as applied in previous runs."""
+        seen_jobs = set()
+        file_path = self.output_file_directory / "success.json"
+        if file_path.exists():
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    seen_jobs.update(job_id_from_link(entry.get("link", "")) for entry in json.load(f))
+            except (json.JSONDecodeError, AttributeError):
+                pass
+        return seen_jobs
 
     def next_job_page(self, position, location, job_page):
-        self.driver.get(f"https://www.linkedin.com/jobs/search/{self.base_search_url}&keywords={position}{location}&start={job_page * 25}")
-
-    def is_blacklisted(self, job_title, company, link):
-        return any([
-            job_title.lower() in self.title_blacklist,
-            company.lower() in self.company_blacklist,
-            link in self.seen_jobs
-        ])    
+        self.driver.get(self.config.search_url(position, location, job_page))
+
+    def is_blacklisted(self, job_title, company, link, location=""):
+        if job_id_from_link(link) in self.seen_jobs:
+            return True
+        reason = self.blacklists.reason(job_title, company, location)
+        if reason:
+            print(f"🚫 {reason}")
+        return reason is not None
+
     def handle_standard_application(self, job):
         try:
-            self.driver.get(job.link)
-            WebDriverWait(self.driver, 10).until(lambda d: d.execute_script('return document.readyState') == 'complete')
+            self.job_details_fetcher.open(job)
             
             apply_button = WebDriverWait(self.driver, 5).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply') or contains(text(), 'Submit')]"))
             )
             apply_button.click()
-            time.sleep(3)
+            pacing.pause("after_click")
 
             # Auto-fill forms where possible
             self._fill_application_fields()
@@ -0,0 +1,191 @@
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: the limiter falls back to in-process budgets only
+    fcntl = None
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class _MemoryState:
+    """Bucket levels shared by the threads of this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = {}
+
+    @contextmanager
+    def locked(self):
+        with self._lock:
+            yield self._state
+
+
+class _FileState:
+    """Bucket levels shared by every process using the same state file, guarded by flock."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def locked(self):
+        with self._lock, open(self.path, 'a+', encoding='utf-8') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except json.JSONDecodeError:
+                    state = {}
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class LLMUnavailableError(Exception):
+    """Raised when an LLM call still fails after the retry budget is spent."""
+
+
+class RateLimiter:
+    """Token-bucket budget of requests and tokens per minute, with jittered exponential backoff.
+
+    Every GPTAnswerer of the process shares one limiter, and with `state_file` the budget is
+    shared across processes too (e.g. several bots on the same API key). Calls failing with a
+    429 or 5xx are retried up to `max_retries` times, honouring Retry-After when present, and
+    all callers share a retry budget of `retries_per_minute` so an outage does not turn into a
+    retry storm. Tokens are taken from the budget on an estimate before the call and settled
+    against the usage the API reports once it returns.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, requests_per_minute: int = 500, tokens_per_minute: int = 30000, max_retries: int = 5,
+                 retries_per_minute: int = 30, base_delay: float = 1.0, max_delay: float = 60.0, state_file: Path = None):
+        self.capacities = {"requests": float(requests_per_minute), "tokens": float(tokens_per_minute),
+                           "retries": float(retries_per_minute)}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = _FileState(state_file) if state_file and fcntl else _MemoryState()
+        self.throttled_seconds = 0.0
+        self.retries = 0
+        self.estimated_tokens = self.used_tokens = 0
+        self._counters_lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict):
+        """Returns the process-wide limiter configured from the `llm` section of config.yaml."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                options = parameters.get('llm') or {}
+                state_file = None
+                # pregeneration workers are separate processes calling the LLM on the same budget
+                pregeneration = (parameters.get('pregeneration') or {}).get('enabled', False)
+                if options.get('share_across_processes', False) or pregeneration:
+                    state_file = Path(parameters['outputFileDirectory']) / "llm_rate_limit.json"
+                cls._shared = cls(
+                    requests_per_minute=options.get('requests_per_minute', 500),
+                    tokens_per_minute=options.get('tokens_per_minute', 30000),
+                    max_retries=options.get('max_retries', 5),
+                    retries_per_minute=options.get('retries_per_minute', 30),
+                    state_file=state_file,
+                )
+            return cls._shared
+
+    @classmethod
+    def shared(cls):
+        return cls.from_parameters({})
+
+    def _take(self, amounts: dict) -> float:
+        """Takes `amounts` from the buckets if they all have enough; otherwise returns the seconds to wait."""
+        with self.state.locked() as state:
+            now = time.time()
+            elapsed = now - state.get("updated", now)
+            levels = {}
+            for bucket, capacity in self.capacities.items():
+                levels[bucket] = min(capacity, state.get(bucket, capacity) + elapsed * capacity / 60)
+            state["updated"] = now
+            wait = 0.0
+            for bucket, amount in amounts.items():
+                amount = min(amount, self.capacities[bucket])
+                if levels[bucket] < amount:
+                    wait = max(wait, (amount - levels[bucket]) * 60 / self.capacities[bucket])
+            if wait == 0.0:
+                for bucket, amount in amounts.items():
+                    levels[bucket] -= min(amount, self.capacities[bucket])
+            state.update(levels)
+            return wait
+
+    def acquire(self, estimated_tokens: int, requests: int = 1) -> None:
+        """Blocks until `requests` requests and `estimated_tokens` tokens fit in the per-minute budget."""
+        while True:
+            wait = self._take({"requests": requests, "tokens": estimated_tokens})
+            if wait == 0.0:
+                return
+            with self._counters_lock:
+                self.throttled_seconds += wait
+            time.sleep(wait)
+
+    def settle(self, estimated_tokens: int, used_tokens: int) -> None:
+        """Corrects the token budget taken for a call on `estimated_tokens` by the tokens it really used."""
+        if used_tokens is None:
+            return
+        charged = min(estimated_tokens, self.capacities["tokens"])
+        with self.state.locked() as state:
+            level = state.get("tokens", self.capacities["tokens"])
+            # may go below zero: the next calls then wait until the overspend has refilled
+            state["tokens"] = min(self.capacities["tokens"], level + charged - used_tokens)
+        with self._counters_lock:
+            self.estimated_tokens += estimated_tokens
+            self.used_tokens += used_tokens
+
+    def call(self, function, estimated_tokens: int = 1000):
+        """Runs `function` within the budget, retrying rate-limit and server errors with backoff."""
+        for attempt in range(self.max_retries + 1):
+            self.acquire(estimated_tokens)
+            try:
+                return function()
+            except Exception as e:
+                status_code = getattr(e, "status_code", None)
+                if status_code not in RETRYABLE_STATUS_CODES and not self._is_connection_error(e):
+                    raise
+                if attempt == self.max_retries or self._take({"retries": 1}) > 0:
+                    raise LLMUnavailableError(f"LLM call failed after {attempt + 1} attempt(s): {e}") from e
+                with self._counters_lock:
+                    self.retries += 1
+                # jitter so concurrent callers do not retry in lockstep
+                retry_after = self._retry_after(e)
+                if retry_after:
+                    delay = retry_after + random.uniform(0, self.base_delay)
+                else:
+                    delay = random.uniform(0.5, 1.0) * min(self.max_delay, self.base_delay * 2 ** attempt)
+                print(f"⏳ LLM call failed ({status_code or type(e).__name__}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+    def report(self) -> str:
+        with self._counters_lock:
+            return (f"LLM budget: {self.throttled_seconds:.0f}s throttled, {self.retries} retries, "
+                    f"{self.used_tokens} tokens used for {self.estimated_tokens} estimated")
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float:
+        response = getattr(error, "response", None)
+        try:
+            return float(response.headers.get("retry-after"))
+        except (AttributeError, TypeError, ValueError):
+            return 0.0
@@ -0,0 +1,103 @@
+import json
+import threading
+
+# Chrome's Network.setBlockedURLs only matches URL patterns, so resource types are
+# blocked through the file extensions they are served with.
+RESOURCE_TYPE_PATTERNS = {
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg", "*.wav"],
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "stylesheet": ["*.css"],
+}
+
+TRACKER_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com/li.lms-analytics*",
+    "*linkedin.com/li/track*",
+    "*linkedin.com/sensorCollect*",
+    "*bat.bing.com*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+]
+
+
+class NetworkPolicy:
+    """Opt-in request blocking and per-page bandwidth accounting via the Chrome DevTools Protocol."""
+
+    def __init__(self, block_patterns=None, block_resource_types=None, block_trackers: bool = True):
+        unknown = set(block_resource_types or []) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types to block: {', '.join(sorted(unknown))}")
+        patterns = list(block_patterns or [])
+        for resource_type in block_resource_types or []:
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        if block_trackers:
+            patterns.extend(TRACKER_PATTERNS)
+        self.blocked_patterns = list(dict.fromkeys(patterns))
+        self.pages = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict):
+        """Builds the policy from the `network` section of config.yaml, or returns None when disabled."""
+        network = parameters.get('network') or {}
+        if not network.get('enabled', False):
+            return None
+        return cls(
+            block_patterns=network.get('block_patterns', []),
+            block_resource_types=network.get('block_resource_types', ["font", "media"]),
+            block_trackers=network.get('block_trackers', True),
+        )
+
+    def apply(self, driver, announce: bool = True) -> None:
+        """Enables the Network domain and installs the blocked URL patterns on the driver's current tab.
+
+        DevTools settings are per tab: tabs opened later (e.g. by JobPrefetcher) need their own call.
+        """
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_patterns})
+        if announce:
+            print(f"🛡️ Network policy active: {len(self.blocked_patterns)} blocked URL patterns.")
+
+    def record_page(self, driver, label: str) -> dict:
+        """Attributes the traffic logged since the previous call to `label`.
+
+        Reads (and drains) Chrome's performance log, which requires the browser to be
+        started with performance logging enabled (see `chromeBrowserOptions`).
+        """
+        page = {"page": label, "requests": 0, "bytes": 0, "blocked": 0}
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            print(f"⚠️ Could not read the performance log: {e}")
+            entries = []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                page["requests"] += 1
+            elif method == "Network.loadingFinished":
+                page["bytes"] += int(params.get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                page["blocked"] += 1
+        with self._lock:
+            self.pages.append(page)
+        return page
+
+    def report(self) -> str:
+        with self._lock:
+            pages = list(self.pages)
+        if not pages:
+            return "No network traffic recorded."
+        total_bytes = sum(page["bytes"] for page in pages)
+        total_requests = sum(page["requests"] for page in pages)
+        total_blocked = sum(page["blocked"] for page in pages)
+        return (f"{len(pages)} pages, {total_requests} requests, {total_blocked} blocked, "
+                f"{total_bytes / 1024 / 1024:.1f} MB ({total_bytes / len(pages) / 1024:.0f} KB/page)")
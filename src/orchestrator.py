@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import src.utils as utils
+
+
+class JobOrchestrator:
+    """Overlaps browser work with LLM and document work while applying to a page of jobs.
+
+    Selenium calls are not thread-safe, so every driver operation runs on a single dedicated
+    browser thread. As soon as a job's description is fetched, its cover letter and tailored
+    resume are started on the document executor, and the browser thread goes on loading,
+    scrolling and clicking through the application. The applier only blocks on a document
+    when it reaches the upload field that needs it.
+    """
+
+    def __init__(self, job_manager, document_workers: int = 2):
+        self.job_manager = job_manager
+        self.browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser")
+        self.document_executor = ThreadPoolExecutor(max_workers=document_workers, thread_name_prefix="documents")
+        self.browser_seconds = 0.0
+        self.document_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, job_manager, parameters: dict):
+        """Builds the orchestrator from the `orchestration` section of config.yaml, or returns None when disabled."""
+        orchestration = parameters.get('orchestration') or {}
+        if not orchestration.get('enabled', False):
+            return None
+        return cls(job_manager, document_workers=orchestration.get('document_workers', 2))
+
+    def apply_all(self, candidates) -> None:
+        asyncio.run(self._apply_all(candidates))
+
+    async def _apply_all(self, candidates) -> None:
+        started = time.perf_counter()
+        self.browser_seconds = self.document_seconds = 0.0
+        document_tasks = []
+        for index, job in enumerate(candidates):
+            await self._in_browser(self._open_candidate, candidates, index)
+            # no documents for jobs rejected on their description, profile preferences or fit
+            if not await self._in_browser(self._check_candidate, job):
+                continue
+            document_tasks.extend(self._prepare_documents(job))
+            await self._in_browser(self._apply_candidate, job)
+
+        await asyncio.gather(*document_tasks, return_exceptions=True)
+        elapsed = time.perf_counter() - started
+        overlapped = max(0.0, self.browser_seconds + self.document_seconds - elapsed)
+        utils.printyellow(f"⚙️ Browser {self.browser_seconds:.0f}s, documents {self.document_seconds:.0f}s, "
+                          f"{overlapped:.0f}s overlapped over {elapsed:.0f}s.")
+
+    async def _in_browser(self, function, *args):
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.browser_executor, function, *args)
+        finally:
+            self.browser_seconds += time.perf_counter() - started
+
+    def _prepare_documents(self, job) -> list:
+        """Starts the documents `job` will need and hands their futures to the applier."""
+        applier = self.job_manager.get_easy_applier()
+        if not job.description:
+            return []
+        generators = {"cover_letter": applier.generate_cover_letter_text}
+        if not applier.resume_path:
+            generators["resume"] = applier.generate_tailored_resume
+        futures = {kind: self.document_executor.submit(self._timed, generate, job) for kind, generate in generators.items()}
+        applier.document_futures[job.job_id] = futures
+        return [asyncio.wrap_future(future) for future in futures.values()]
+
+    def _timed(self, function, job):
+        started = time.perf_counter()
+        try:
+            return function(job)
+        finally:
+            with self._lock:
+                self.document_seconds += time.perf_counter() - started
+
+    def _open_candidate(self, candidates, index) -> None:
+        self.job_manager.job_prefetcher.prefetch(candidates[index:])
+        try:
+            self.job_manager.fetch_job_details(candidates[index])
+        except Exception as e:
+            # apply_to_job fetches again and records the failure
+            utils.printred(f"⚠️ Could not fetch details for {candidates[index].title}: {e}")
+
+    def _check_candidate(self, job) -> bool:
+        if self.job_manager.passes_description_checks(job):
+            return True
+        self.job_manager.write_to_file(job, "skipped")
+        self.job_manager.job_prefetcher.release()
+        return False
+
+    def _apply_candidate(self, job) -> bool:
+        try:
+            return self.job_manager.apply_to_job(job)
+        finally:
+            self.job_manager.job_prefetcher.release()
+            self.job_manager.easy_applier_component.document_futures.pop(job.job_id, None)
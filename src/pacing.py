@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+
+# Every intentional wait in the bot goes through one of these named delay points.
+# Each profile maps a delay point to a (min, max) range in seconds.
+DELAY_POINTS = (
+    "scroll_step",      # between two scroll increments inside an element
+    "scroll_settle",    # after the final scroll position is reached
+    "list_step",        # between two results list loading steps
+    "page_load",        # after navigating to a search results page
+    "between_pages",    # between two search result pages
+    "after_click",      # after clicking an apply / next button
+    "before_submit",    # before the final "Submit application" click
+    "after_submit",     # after the final "Submit application" click
+    "next_step",        # after moving to the next Easy Apply step
+    "discard",          # while discarding an incomplete application
+    "upload",           # after sending a file to an upload field
+    "retry",            # after a refresh before retrying an action
+    "login_check",      # before looking for the profile icon to confirm a login
+    "login_redirect",   # after submitting credentials
+)
+
+PROFILES = {
+    "cautious": {
+        "scroll_step": (1.5, 3.5),
+        "scroll_settle": (1.0, 2.0),
+        "list_step": (0.8, 1.6),
+        "page_load": (2.5, 5.0),
+        "between_pages": (30, 60),
+        "after_click": (2.0, 4.0),
+        "before_submit": (2.5, 4.0),
+        "after_submit": (2.5, 4.0),
+        "next_step": (4.0, 7.0),
+        "discard": (3.0, 5.0),
+        "upload": (2.0, 3.0),
+        "retry": (3.0, 5.0),
+        "login_check": (3.0, 4.0),
+        "login_redirect": (5.0, 7.0),
+    },
+    "normal": {
+        "scroll_step": (1.0, 2.6),
+        "scroll_settle": (1.0, 1.0),
+        "list_step": (0.3, 0.8),
+        "page_load": (1.5, 3.5),
+        "between_pages": (10, 30),
+        "after_click": (2.0, 2.0),
+        "before_submit": (1.5, 2.5),
+        "after_submit": (1.5, 2.5),
+        "next_step": (3.0, 5.0),
+        "discard": (3.0, 5.0),
+        "upload": (2.0, 2.0),
+        "retry": (3.0, 3.0),
+        "login_check": (3.0, 3.0),
+        "login_redirect": (5.0, 5.0),
+    },
+    "fixture": {point: (0, 0) for point in DELAY_POINTS},
+}
+
+PROFILE_ALIASES = {
+    "zero-delay": "fixture",
+    "zero": "fixture",
+}
+
+
+class PacingPolicy:
+    """Resolves named delay points to sleeps and keeps track of the time spent idle."""
+
+    def __init__(self, profile: str = "normal", overrides: dict = None):
+        name = PROFILE_ALIASES.get(profile, profile)
+        if name not in PROFILES:
+            raise ValueError(f"Unknown pacing profile '{profile}'. Available: {', '.join(PROFILES)}")
+        self.profile = name
+        self.delays = dict(PROFILES[name])
+        for point, bounds in (overrides or {}).items():
+            if point not in self.delays:
+                raise ValueError(f"Unknown delay point '{point}' in pacing overrides.")
+            low, high = (bounds, bounds) if isinstance(bounds, (int, float)) else bounds
+            if low < 0 or high < low:
+                raise ValueError(f"Invalid range for delay point '{point}': {bounds}")
+            self.delays[point] = (low, high)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.idle_seconds = 0.0
+            self.idle_by_point = {}
+
+    def delay(self, point: str) -> float:
+        """Returns a randomized delay in seconds for the given delay point."""
+        low, high = self.delays[point]
+        return random.uniform(low, high) if high > low else float(low)
+
+    def pause(self, point: str) -> float:
+        """Sleeps for the delay configured for `point` and records it as idle time."""
+        seconds = self.delay(point)
+        if seconds > 0:
+            time.sleep(seconds)
+        with self._lock:
+            self.idle_seconds += seconds
+            self.idle_by_point[point] = self.idle_by_point.get(point, 0.0) + seconds
+        return seconds
+
+    def report(self) -> str:
+        with self._lock:
+            parts = [f"{point}={seconds:.1f}s" for point, seconds in
+                     sorted(self.idle_by_point.items(), key=lambda item: item[1], reverse=True)]
+            return f"Idle {self.idle_seconds:.1f}s with '{self.profile}' pacing ({', '.join(parts) or 'no pauses'})"
+
+
+_policy = PacingPolicy()
+_configured_from = None  # (profile, overrides) of the last configure_from_parameters
+_configure_lock = threading.Lock()
+
+
+def configure(profile: str = "normal", overrides: dict = None) -> PacingPolicy:
+    """Replaces the process-wide pacing policy."""
+    global _policy
+    _policy = PacingPolicy(profile, overrides)
+    return _policy
+
+
+def configure_from_parameters(parameters: dict) -> PacingPolicy:
+    """Reads the `pacing` key of config.yaml, either a profile name or {profile, overrides}.
+
+    Every worker's job manager calls this: the same settings keep the current policy and its
+    idle statistics instead of replacing them.
+    """
+    global _configured_from
+    pacing = parameters.get('pacing') or "normal"
+    if isinstance(pacing, str):
+        settings = (pacing, None)
+    else:
+        settings = (pacing.get('profile', "normal"), pacing.get('overrides'))
+    with _configure_lock:
+        if settings != _configured_from:
+            configure(*settings)
+            _configured_from = settings
+        return _policy
+
+
+def get_policy() -> PacingPolicy:
+    return _policy
+
+
+def pause(point: str) -> float:
+    return _policy.pause(point)
@@ -0,0 +1,205 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+from importlib import metadata
+from pathlib import Path
+from src.json_store import locked_json
+
+
+class ResumeCache:
+    """On-disk cache of resume PDFs rendered by the resume builder.
+
+    Rendering a resume means LLM calls plus an HTML to PDF conversion, so PDFs are stored in
+    the output folder under a key derived from everything that shapes them: the resume YAML,
+    the selected style and the resume builder version (which pins its model and prompts).
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_parameters(cls, parameters: dict):
+        return cls(Path(parameters['outputFileDirectory']) / "resume_cache")
+
+    @staticmethod
+    def _builder_version() -> str:
+        try:
+            return metadata.version("lib_resume_builder_AIHawk")
+        except metadata.PackageNotFoundError:
+            return "unknown"
+
+    @staticmethod
+    def _style_fingerprint(resume_generator_manager) -> str:
+        """Selected style name and the contents of its stylesheet, when the manager exposes them."""
+        style = getattr(resume_generator_manager, "selected_style", None)
+        style_manager = getattr(resume_generator_manager, "style_manager", None)
+        try:
+            style_css = Path(style_manager.get_style_path(style)).read_bytes()
+        except Exception:
+            style_css = b""
+        return f"{style}:{hashlib.sha256(style_css).hexdigest()}"
+
+    @classmethod
+    def resume_key(cls, resume_yaml: str, resume_generator_manager) -> str:
+        fingerprint = json.dumps([resume_yaml, cls._style_fingerprint(resume_generator_manager), cls._builder_version()])
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+    def base_pdf_base64(self, resume_yaml: str, resume_generator_manager) -> str:
+        """Base64 of the generic (not job-tailored) resume PDF, rendered only when the inputs changed."""
+        pdf_path = self.cache_dir / f"resume_{self.resume_key(resume_yaml, resume_generator_manager)}.pdf"
+        if pdf_path.exists():
+            print(f"📄 Using cached resume PDF {pdf_path.name}.")
+            return base64.b64encode(pdf_path.read_bytes()).decode("ascii")
+
+        pdf_base64 = resume_generator_manager.pdf_base64()
+        # write then rename, so an interrupted run never leaves a truncated PDF in the cache
+        partial_path = pdf_path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.part")
+        partial_path.write_bytes(base64.b64decode(pdf_base64))
+        partial_path.replace(pdf_path)
+        for stale_path in self.cache_dir.glob("resume_*.pdf"):
+            if stale_path != pdf_path:
+                stale_path.unlink(missing_ok=True)
+        return pdf_base64
+
+
+class TailoredResumeCache:
+    """Job-tailored resume PDFs in generated_cv/, reused by jobs with the same description.
+
+    Files are named after the base resume key and a hash of the normalized description, so a
+    job seen again (or reposted) gets the PDF rendered the first time. With a
+    `similarity_threshold`, a description whose word shingles overlap an already rendered one
+    at least that much (Jaccard similarity) reuses its PDF as well. The directory is kept under
+    `max_megabytes` by deleting the least recently used PDFs.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, directory: Path, resume_key: str, max_megabytes: float = 200, similarity_threshold: float = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.resume_key = resume_key
+        self.max_bytes = int(max_megabytes * 1024 * 1024)
+        self.similarity_threshold = similarity_threshold
+        self.index_path = self.directory / "index.json"
+        self.index = self._load_index()
+        self.hits = self.similar_hits = self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict, resume_generator_manager):
+        """Returns the cache shared by every applier of the process, configured from `tailored_resumes`."""
+        options = parameters.get('tailored_resumes') or {}
+        plain_text_resume = parameters.get('uploads', {}).get('plainTextResume')
+        resume_yaml = Path(plain_text_resume).read_text(encoding="utf-8") if plain_text_resume else ""
+        resume_key = ResumeCache.resume_key(resume_yaml, resume_generator_manager)
+        directory = Path(options.get('directory', 'generated_cv'))
+        with cls._instances_lock:
+            instance = cls._instances.get(directory)
+            if instance is None or instance.resume_key != resume_key:
+                instance = cls._instances[directory] = cls(
+                    directory, resume_key,
+                    max_megabytes=options.get('max_megabytes', 200),
+                    similarity_threshold=options.get('similarity_threshold'),
+                )
+            return instance
+
+    @staticmethod
+    def normalize(description: str) -> str:
+        """Lowercase words only, so whitespace, markup and punctuation changes do not miss the cache."""
+        return " ".join(re.findall(r"\w+", (description or "").lower()))
+
+    @staticmethod
+    def shingles(normalized: str, size: int = 3) -> set:
+        words = normalized.split()
+        return {zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) for i in range(max(1, len(words) - size + 1))}
+
+    def _file_name(self, normalized: str) -> str:
+        description_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+        return f"CV_{self.resume_key[:8]}_{description_hash}.pdf"
+
+    def get_or_create(self, description: str, generate) -> str:
+        """Path of the tailored PDF for `description`; `generate(description)` returns its base64 on a miss."""
+        normalized = self.normalize(description)
+        file_name = self._file_name(normalized)
+        shingles = self.shingles(normalized)
+        cached = self._lookup(file_name, shingles)
+        if cached is not None:
+            return str(cached.resolve())
+
+        pdf_path = self.directory / file_name
+        # named per process and thread: pregeneration workers render into the same directory
+        partial_path = pdf_path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.part")
+        partial_path.write_bytes(base64.b64decode(generate(description)))
+        partial_path.replace(pdf_path)
+        with self._lock:
+            self.misses += 1
+            self.index[file_name] = sorted(shingles)
+            self._evict(keep=file_name)
+            self._save_index()
+        return str(pdf_path.resolve())
+
+    def _lookup(self, file_name: str, shingles: set):
+        with self._lock:
+            pdf_path = self.directory / file_name
+            if pdf_path.exists():
+                self.hits += 1
+                os.utime(pdf_path)  # recently used, see _evict
+                return pdf_path
+            if not self.similarity_threshold:
+                return None
+            best_name, best_similarity = None, 0.0
+            prefix = file_name.rsplit("_", 1)[0]
+            for name, other in self.index.items():
+                if not name.startswith(prefix):
+                    continue  # rendered from another version of the resume
+                other = set(other)
+                similarity = len(shingles & other) / len(shingles | other) if shingles or other else 0.0
+                if similarity > best_similarity:
+                    best_name, best_similarity = name, similarity
+            if best_name and best_similarity >= self.similarity_threshold and (self.directory / best_name).exists():
+                self.similar_hits += 1
+                print(f"♻️ Reusing tailored resume {best_name} ({best_similarity:.0%} similar description).")
+                os.utime(self.directory / best_name)
+                return self.directory / best_name
+            return None
+
+    def _evict(self, keep: str) -> None:
+        """Deletes the least recently used PDFs until the directory fits in `max_bytes`."""
+        pdf_paths = sorted(self.directory.glob("CV_*.pdf"), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in pdf_paths)
+        for path in pdf_paths:
+            if total <= self.max_bytes:
+                break
+            if path.name == keep:
+                continue
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            self.index.pop(path.name, None)
+        for name in [name for name in self.index if not (self.directory / name).exists()]:
+            del self.index[name]
+
+    def report(self) -> str:
+        with self._lock:
+            return (f"Tailored resumes: {self.hits} reused, {self.similar_hits} reused from a similar description, "
+                    f"{self.misses} generated")
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self) -> None:
+        """Merges the index with the entries other processes saved meanwhile; evicted PDFs drop out."""
+        with locked_json(self.index_path) as index:
+            index.update(self.index)
+            for name in [name for name in index if not (self.directory / name).exists()]:
+                del index[name]
+        self.index = index
@@ -0,0 +1,50 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+import yaml
+
+# libyaml's loader is several times faster than the pure Python one; same safe subset of YAML
+SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_parsed = {}  # sha256 of the file -> ParsedResume
+_parsed_lock = threading.Lock()
+
+
+def parse(text: str):
+    return yaml.load(text, Loader=SAFE_LOADER)
+
+
+@dataclass(frozen=True)
+class ParsedResume:
+    """plain_text_resume.yaml parsed once: its text, its sha256 and the YAML tree.
+
+    JobApplicationProfile and the fit scorer build from the same tree, which must not be
+    modified. The resume builder's Resume is the exception: its only public constructor takes
+    the text, which it parses again with yaml.safe_load, so a run still parses the resume twice
+    (once more in each pregeneration worker). Parses are kept in memory by file hash, and worker
+    processes are handed the ParsedResume itself.
+    """
+
+    text: str
+    digest: str
+    data: dict
+
+    @classmethod
+    def load(cls, path: Path) -> "ParsedResume":
+        text = Path(path).read_text(encoding="utf-8")
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with _parsed_lock:
+            if digest in _parsed:
+                return _parsed[digest]
+        try:
+            parsed = cls(text, digest, parse(text))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML file {path}.") from e
+        with _parsed_lock:
+            return _parsed.setdefault(digest, parsed)
+
+    @classmethod
+    def from_parameters(cls, parameters: dict) -> "ParsedResume":
+        """The plain text resume of the run."""
+        return cls.load(parameters['uploads']['plainTextResume'])
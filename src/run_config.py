@@ -0,0 +1,143 @@
+import threading
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import quote, urlencode
+
+SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+RESULTS_PER_PAGE = 25
+
+# LinkedIn search filter codes of the config.yaml keys
+EXPERIENCE_LEVELS = {"internship": "1", "entry": "2", "associate": "3", "mid-senior level": "4", "director": "5",
+                     "executive": "6"}
+JOB_TYPES = {"full-time": "F", "contract": "C", "part-time": "P", "temporary": "T", "internship": "I", "other": "O",
+             "volunteer": "V"}
+DATE_FILTERS = {"all time": None, "month": "r2592000", "week": "r604800", "24 hours": "r86400"}
+WORK_TYPES = {"onsite": "1", "remote": "2", "hybrid": "3"}
+DISTANCES = (0, 5, 10, 25, 50, 100)
+
+
+class ConfigError(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class RunConfig:
+    """The search part of config.yaml, validated and compiled once per run.
+
+    Every position×location search URL is built and URL-encoded up front; only the page
+    offset is appended while paging. Compiled configurations are cached by content, so
+    every job manager of the run shares the same one.
+    """
+
+    positions: tuple
+    locations: tuple
+    filter_query: str  # encoded work type, experience, job type, date and distance filters
+    search_urls: MappingProxyType  # (position, location) -> search URL without the page offset
+    resume_path: Path | None
+    output_directory: Path
+
+    @property
+    def searches(self) -> tuple:
+        """Every (position, location) pair, in config order."""
+        return tuple(self.search_urls)
+
+    def search_url(self, position: str, location: str, page: int) -> str:
+        base_url = self.search_urls.get((position, location)) or self._build_search_url(self.filter_query, position, location)
+        return f"{base_url}&start={(page - 1) * RESULTS_PER_PAGE}"
+
+    @staticmethod
+    def _build_search_url(filter_query: str, position: str, location: str) -> str:
+        query = urlencode({"keywords": position, "location": location}, quote_via=quote)
+        return f"{SEARCH_URL}?{filter_query}&{query}" if filter_query else f"{SEARCH_URL}?{query}"
+
+    @classmethod
+    def compile(cls, parameters: dict) -> "RunConfig":
+        """Validates `parameters` and returns their compiled form, reusing it for identical parameters.
+
+        Raises ConfigError listing every invalid setting.
+        """
+        fingerprint = repr(parameters)
+        with _cache_lock:
+            if fingerprint not in _cache:
+                _cache[fingerprint] = cls._compile(parameters)
+            return _cache[fingerprint]
+
+    @classmethod
+    def _compile(cls, parameters: dict) -> "RunConfig":
+        errors = []
+        positions = cls._strings(parameters, 'positions', errors)
+        locations = cls._strings(parameters, 'locations', errors)
+
+        filters = []
+        work_types = []
+        for key, code in WORK_TYPES.items():
+            value = parameters.get(key, False)
+            if not isinstance(value, bool):
+                errors.append(f"'{key}' must be true or false, not {value!r}")
+            elif value:
+                work_types.append(code)
+        if work_types:
+            filters.append(("f_WT", ",".join(work_types)))
+
+        experience_levels = [EXPERIENCE_LEVELS[key] for key in cls._flags(parameters, 'experienceLevel', EXPERIENCE_LEVELS, errors)]
+        if experience_levels:
+            filters.append(("f_E", ",".join(experience_levels)))
+        job_types = [JOB_TYPES[key] for key in cls._flags(parameters, 'jobTypes', JOB_TYPES, errors)]
+        if job_types:
+            filters.append(("f_JT", ",".join(job_types)))
+        dates = cls._flags(parameters, 'date', DATE_FILTERS, errors)
+        if dates and DATE_FILTERS[dates[0]]:  # the first date selected in config.yaml wins
+            filters.append(("f_TPR", DATE_FILTERS[dates[0]]))
+
+        distance = parameters.get('distance')
+        if distance is not None:
+            if distance not in DISTANCES:
+                errors.append(f"'distance' must be one of {', '.join(map(str, DISTANCES))}, not {distance!r}")
+            else:
+                filters.append(("distance", str(distance)))
+
+        if 'outputFileDirectory' not in parameters:
+            errors.append("'outputFileDirectory' is not set")
+        if errors:
+            raise ConfigError("❌ Invalid config.yaml:\n" + "\n".join(f"  - {error}" for error in errors))
+
+        filter_query = urlencode(filters, safe=",", quote_via=quote)
+        search_urls = {(position, location): cls._build_search_url(filter_query, position, location)
+                       for position, location in product(positions, locations)}
+        resume_path = (parameters.get('uploads') or {}).get('resume')
+        return cls(
+            positions=positions,
+            locations=locations,
+            filter_query=filter_query,
+            search_urls=MappingProxyType(search_urls),
+            resume_path=Path(resume_path) if resume_path and Path(resume_path).exists() else None,
+            output_directory=Path(parameters['outputFileDirectory']),
+        )
+
+    @staticmethod
+    def _strings(parameters: dict, key: str, errors: list) -> tuple:
+        values = parameters.get(key) or []
+        if not isinstance(values, list) or not all(isinstance(value, str) and value.strip() for value in values):
+            errors.append(f"'{key}' must be a list of non-empty strings")
+            return ()
+        if not values:
+            errors.append(f"'{key}' must list at least one entry")
+        return tuple(value.strip() for value in values)
+
+    @staticmethod
+    def _flags(parameters: dict, key: str, known: dict, errors: list) -> list:
+        """Names set to true in the `key` section, in config order."""
+        flags = parameters.get(key) or {}
+        if not isinstance(flags, dict):
+            errors.append(f"'{key}' must map {', '.join(known)} to true or false")
+            return []
+        unknown = [name for name in flags if name not in known]
+        if unknown:
+            errors.append(f"unknown '{key}' entries {', '.join(map(str, unknown))}; expected {', '.join(known)}")
+        return [name for name, value in flags.items() if value and name in known]
+
+
+_cache = {}
+_cache_lock = threading.Lock()
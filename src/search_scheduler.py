@@ -0,0 +1,99 @@
+import json
+import random
+import threading
+from pathlib import Path
+
+
+class SearchScheduler:
+    """Orders position×location searches by their historical yield and decides when to stop paging.
+
+    The yield of a results page is the share of its tiles that are new, unseen Easy Apply jobs.
+    Paging stops once the yield stays below `min_yield` for `patience` consecutive pages, and
+    statistics are persisted so later runs start with the queries that produced the most jobs.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, stats_path: Path, min_yield: float = 0.1, patience: int = 3, max_pages: int = 40):
+        self.stats_path = Path(stats_path)
+        self.min_yield = min_yield
+        self.patience = max(1, patience)
+        self.max_pages = max_pages
+        self.stats = self._load()
+        self._low_yield_pages = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_parameters(cls, parameters: dict):
+        """Returns the scheduler shared by every job manager writing to the same output folder."""
+        options = parameters.get('search_scheduler') or {}
+        stats_path = Path(parameters['outputFileDirectory']) / "search_stats.json"
+        with cls._instances_lock:
+            if stats_path not in cls._instances:
+                cls._instances[stats_path] = cls(
+                    stats_path,
+                    min_yield=options.get('min_yield', 0.1),
+                    patience=options.get('patience', 3),
+                    max_pages=options.get('max_pages', 40),
+                )
+            return cls._instances[stats_path]
+
+    @staticmethod
+    def _key(position: str, location: str) -> str:
+        return f"{position}|{location}"
+
+    def historical_yield(self, position: str, location: str) -> float:
+        """New Easy Apply jobs per page found by this query in previous runs.
+
+        Queries that never ran get an optimistic score so they are explored early.
+        """
+        entry = self.stats.get(self._key(position, location))
+        if not entry or not entry.get("pages"):
+            return float("inf")
+        return entry["new_easy_apply_jobs"] / entry["pages"]
+
+    def order(self, searches) -> list:
+        """Most productive queries first; ties (e.g. never ran) are shuffled."""
+        searches = list(searches)
+        random.shuffle(searches)
+        return sorted(searches, key=lambda search: self.historical_yield(*search), reverse=True)
+
+    def record_page(self, position: str, location: str, page_number: int, job_list, candidates) -> bool:
+        """Records the yield of one results page and returns whether the next page is worth loading."""
+        key = self._key(position, location)
+        new_easy_apply = sum(1 for job in candidates if job.apply_method == "Easy Apply")
+        page_yield = new_easy_apply / len(job_list) if job_list else 0.0
+
+        with self._lock:
+            entry = self.stats.setdefault(key, {"runs": 0, "pages": 0, "tiles": 0, "new_easy_apply_jobs": 0})
+            if page_number == 1:
+                entry["runs"] += 1
+                self._low_yield_pages[key] = 0
+            entry["pages"] += 1
+            entry["tiles"] += len(job_list)
+            entry["new_easy_apply_jobs"] += new_easy_apply
+            entry["last_yield"] = round(page_yield, 3)
+            self._low_yield_pages[key] = self._low_yield_pages.get(key, 0) + 1 if page_yield < self.min_yield else 0
+            low_yield_pages = self._low_yield_pages[key]
+            self._save()
+
+        print(f"📈 {position} in {location}, page {page_number}: {new_easy_apply} new Easy Apply jobs "
+              f"out of {len(job_list)} ({page_yield:.0%} yield).")
+        if not job_list:
+            return False
+        if low_yield_pages >= self.patience:
+            print(f"⏹️ Yield below {self.min_yield:.0%} for {low_yield_pages} page(s), stopping this search.")
+            return False
+        return page_number < self.max_pages
+
+    def _load(self) -> dict:
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self) -> None:
+        with open(self.stats_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats, f, indent=4)
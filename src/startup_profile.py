@@ -0,0 +1,94 @@
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Times the startup phases and the imports they trigger, for `main.py --startup-profile`.
+
+    While enabled, `__import__` is wrapped so that loading a module not yet in sys.modules is
+    timed and charged to its top-level package. A package only gets its own time: the nested
+    modules it pulls in (pydantic under langchain) are charged to theirs, so the times add up.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.imports = {}
+        self._stack = []  # time of the nested imports of each import in progress (startup thread only)
+        self._original_import = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._reported = False
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.started = time.perf_counter()
+        self._thread = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        top_level = name.partition(".")[0]
+        if level or name in sys.modules or threading.get_ident() != self._thread:
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.imports[top_level] = self.imports.get(top_level, 0.0) + elapsed - nested
+
+    @contextmanager
+    def phase(self, name: str):
+        """Adds the time spent in the block to phase `name`; phases run by several workers add up."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                with self._lock:
+                    self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def report(self, top: int = 15) -> str:
+        total = time.perf_counter() - self.started
+        phases = "\n".join(f"   {name:<20} {seconds:7.2f}s" for name, seconds in self.phases.items())
+        slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]
+        imports = "\n".join(f"   {name:<20} {seconds:7.2f}s" for name, seconds in slowest)
+        return (f"⏱️ Startup profile ({total:.2f}s in total):\n"
+                f" Phases:\n{phases or '   none'}\n"
+                f" Imports ({sum(self.imports.values()):.2f}s, slowest first):\n{imports or '   none'}")
+
+    def report_once(self) -> None:
+        """Prints the report the first time startup completes, then stops timing imports."""
+        with self._lock:
+            if not self.enabled or self._reported:
+                return
+            self._reported = True
+            builtins.__import__ = self._original_import
+        print(self.report())
+
+
+_profiler = StartupProfiler()
+
+
+def enable() -> StartupProfiler:
+    _profiler.enable()
+    return _profiler
+
+
+def phase(name: str):
+    return _profiler.phase(name)
+
+
+def report_once() -> None:
+    _profiler.report_once()
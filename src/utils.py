@@ -1,19 +1,18 @@
 import os
-import random
-import time
 from selenium import webdriver
+import src.pacing as pacing
 
 chromeProfilePath = os.path.join(os.getcwd(), "chrome_profile", "linkedin_profile")
 
 
-def ensure_chrome_profile():
+def ensure_chrome_profile(profile_path=chromeProfilePath):
     """Ensures the Chrome profile directory exists and returns the profile path."""
-    profile_dir = os.path.dirname(chromeProfilePath)
+    profile_dir = os.path.dirname(profile_path)
     if not os.path.exists(profile_dir):
         os.makedirs(profile_dir)
-    if not os.path.exists(chromeProfilePath):
-        os.makedirs(chromeProfilePath)
-    return chromeProfilePath
+    if not os.path.exists(profile_path):
+        os.makedirs(profile_path)
+    return profile_path
 
 
 def is_scrollable(element):
@@ -50,21 +49,26 @@ def scroll_slow(driver, scrollable_element, start=0, end=3600, step=100, reverse
                     driver.execute_script("arguments[0].scrollTop = arguments[1];", scrollable_element, position)
                 except Exception as e:
                     printred(f"❌ Error during scrolling: {e}")
-                time.sleep(random.uniform(1.0, 2.6))
+                pacing.pause("scroll_step")
 
             driver.execute_script("arguments[0].scrollTop = arguments[1];", scrollable_element, end)
-            time.sleep(1)
+            pacing.pause("scroll_settle")
         else:
             printyellow("⚠️ The element is not visible.")
     except Exception as e:
         printred(f"❌ Exception occurred during scrolling: {e}")
 
 
-def chromeBrowserOptions():
+def chromeBrowserOptions(capture_network=False, headless=False, profile_path=chromeProfilePath):
     """Sets up Chrome browser options for automation."""
-    ensure_chrome_profile()
+    if profile_path:
+        ensure_chrome_profile(profile_path)
     options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")  # Start browser maximized
+    if headless:
+        options.add_argument("--headless=new")  # Run without a visible window
+        options.add_argument("--window-size=1920,1080")  # Headless has no screen to maximize to
+    else:
+        options.add_argument("--start-maximized")  # Start browser maximized
     options.add_argument("--no-sandbox")  # Disable sandboxing for better performance
     options.add_argument("--disable-dev-shm-usage")  # Use temp directory for shared memory
     options.add_argument("--ignore-certificate-errors")  # Ignore SSL certificate errors
@@ -91,9 +95,13 @@ def chromeBrowserOptions():
     }
     options.add_experimental_option("prefs", prefs)
 
-    if chromeProfilePath:
-        initialPath = os.path.dirname(chromeProfilePath)
-        profileDir = os.path.basename(chromeProfilePath)
+    if capture_network:
+        # Performance log feeds per-page request and byte accounting (see src/network_policy.py)
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    if profile_path:
+        initialPath = os.path.dirname(profile_path)
+        profileDir = os.path.basename(profile_path)
         options.add_argument('--user-data-dir=' + initialPath)
         options.add_argument("--profile-directory=" + profileDir)
     else:
@@ -0,0 +1,116 @@
+import os
+import queue
+import shutil
+import threading
+import time
+import src.utils as utils
+from src.browser_bootstrap import init_browsers
+
+# Chrome refuses to open a profile that another instance holds, and caches are not worth copying
+_PROFILE_COPY_IGNORE = shutil.ignore_patterns(
+    "Singleton*", "*.lock", "lockfile", "LOCK", "Cache", "Code Cache", "GPUCache", "Service Worker"
+)
+# Files carrying the login; a clone older than any of them is copied again
+_PROFILE_STATE_FILES = ("Cookies", os.path.join("Network", "Cookies"), "Login Data", "Preferences")
+_CLONED_STAMP = ".cloned"
+
+
+def _profile_updated_at(source_profile: str) -> float:
+    paths = [os.path.join(source_profile, name) for name in _PROFILE_STATE_FILES]
+    paths.append(os.path.join(os.path.dirname(source_profile), "Local State"))
+    return max((os.path.getmtime(path) for path in paths if os.path.exists(path)), default=0.0)
+
+
+def clone_chrome_profile(worker_id: int, source_profile: str = utils.chromeProfilePath) -> str:
+    """Copies the logged-in profile into chrome_profile/worker_<id>/ and returns the cloned profile path.
+
+    The copy is made again when the source profile was updated since, e.g. after logging in anew.
+    """
+    source_root = os.path.dirname(source_profile)
+    worker_root = os.path.join(source_root, f"worker_{worker_id}")
+    target_profile = os.path.join(worker_root, os.path.basename(source_profile))
+    stamp = os.path.join(worker_root, _CLONED_STAMP)
+    utils.ensure_chrome_profile(source_profile)
+    if os.path.exists(target_profile):
+        cloned_at = os.path.getmtime(stamp) if os.path.exists(stamp) else 0.0
+        if _profile_updated_at(source_profile) <= cloned_at:
+            return target_profile
+        print(f"🔄 Refreshing the Chrome profile of worker {worker_id}...")
+        shutil.rmtree(target_profile)
+    started = time.time()
+    shutil.copytree(source_profile, target_profile, ignore=_PROFILE_COPY_IGNORE)
+    # "Local State" holds the key the profile's cookies are encrypted with
+    local_state = os.path.join(source_root, "Local State")
+    if os.path.exists(local_state):
+        shutil.copy2(local_state, os.path.join(worker_root, "Local State"))
+    with open(stamp, "w"):
+        pass
+    os.utime(stamp, (started, started))  # changes made to the source while copying are picked up next time
+    return target_profile
+
+
+class BrowserWorkerPool:
+    """Runs position×location searches across N Chrome instances pulling from one shared queue.
+
+    `build_job_manager(browser)` must return a logged-in, configured LinkedInJobManager for the
+    given browser. Workers share the process-wide answer store and results ledger, and one
+    seen-jobs index so two workers never apply to the same job.
+    """
+
+    def __init__(self, worker_count: int, build_job_manager, headless: bool = False, capture_network: bool = False):
+        self.worker_count = worker_count
+        self.build_job_manager = build_job_manager
+        self.headless = headless
+        self.capture_network = capture_network
+        self.seen_jobs = set()
+        self.searches_done = {}
+        self.job_manager = None  # any worker's job manager, for the run-wide reports
+        self._lock = threading.Lock()
+
+    def run(self, searches) -> None:
+        search_queue = queue.Queue()
+        for search in searches:
+            search_queue.put(search)
+
+        worker_count = max(1, min(self.worker_count, search_queue.qsize()))
+        profile_paths = [clone_chrome_profile(worker_id) for worker_id in range(1, worker_count + 1)]
+        browsers = init_browsers(profile_paths, headless=self.headless, capture_network=self.capture_network)
+
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._work, args=(worker_id, browser, search_queue), name=f"worker-{worker_id}")
+            for worker_id, browser in enumerate(browsers, start=1)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        per_worker = ", ".join(f"worker {worker_id}: {count}" for worker_id, count in sorted(self.searches_done.items()))
+        utils.printyellow(f"🏁 {worker_count} workers finished in {time.perf_counter() - started:.0f}s ({per_worker}).")
+        if self.job_manager is not None:
+            self.job_manager.report_run()
+
+    def _work(self, worker_id: int, browser, search_queue: queue.Queue) -> None:
+        try:
+            job_manager = self.build_job_manager(browser)
+            with self._lock:
+                self.job_manager = job_manager
+                self.seen_jobs.update(job_manager.seen_jobs)
+            job_manager.seen_jobs = self.seen_jobs
+            job_manager.run_searches(self._drain(worker_id, search_queue))
+            job_manager.report_network()
+        except Exception as e:
+            utils.printred(f"❌ Worker {worker_id} stopped: {e}")
+        finally:
+            browser.quit()
+
+    def _drain(self, worker_id: int, search_queue: queue.Queue):
+        while True:
+            try:
+                search = search_queue.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                self.searches_done[worker_id] = self.searches_done.get(worker_id, 0) + 1
+            yield search
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# the modules are imported as src.<module>, from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.job import Job  # noqa: E402
+
+
+@pytest.fixture
+def make_job():
+    def make(job_id="1", title="Software Engineer", company="Acme", location="Berlin, Germany",
+             description="", apply_method="Easy Apply"):
+        return Job(title, company, location, f"https://www.linkedin.com/jobs/view/{job_id}/", apply_method,
+                   description=description)
+    return make
@@ -0,0 +1,45 @@
+import pytest
+
+from src.blacklist import BlacklistMatcher, JobBlacklists, normalize
+from src.run_config import ConfigError
+
+
+def test_normalize_folds_case_accents_and_whitespace():
+    assert normalize("  Café   Noir ") == "cafe noir"
+
+
+def test_literal_entries_match_whole_words_only():
+    matcher = BlacklistMatcher(["Noir"])
+    assert matcher.match("Senior Noir Engineer") == "Noir"
+    assert matcher.match("Noirette") is None
+
+
+def test_contains_entries_match_substrings():
+    assert BlacklistMatcher(["contains:noir"]).match("Noirette Labs") == "contains:noir"
+
+
+def test_regex_entries_ignore_case():
+    assert BlacklistMatcher(["regex:^Senior"]).match("Senior dev") == "regex:^Senior"
+
+
+def test_regex_groups_do_not_clash_with_generated_names():
+    matcher = BlacklistMatcher(["regex:(?P<r0>lead)", "regex:(?P<x>head) of"])
+    assert matcher.match("Team lead") == "regex:(?P<r0>lead)"
+    assert matcher.match("Head of data") == "regex:(?P<x>head) of"
+
+
+def test_invalid_regex_names_the_entry():
+    with pytest.raises(ConfigError, match="regex:\\(unclosed"):
+        BlacklistMatcher(["regex:(unclosed"])
+
+
+def test_find_all_returns_every_matching_entry():
+    matcher = BlacklistMatcher(["senior", "contains:lead", "regex:manager$"])
+    assert matcher.find_all("Senior Team Leader, Engineering Manager") == {"senior", "contains:lead", "regex:manager$"}
+
+
+def test_job_blacklists_accept_both_spellings():
+    blacklists = JobBlacklists.from_parameters({"companyBlacklist": ["Acme"], "title_blacklist": ["intern"]})
+    assert blacklists.reason("Engineer", "Acme Corp") == "company matches 'Acme'"
+    assert blacklists.reason("Summer Intern", "Other") == "title matches 'intern'"
+    assert blacklists.reason("Engineer", "Other") is None
@@ -0,0 +1,36 @@
+from src.description_filter import DescriptionFilter
+
+
+def test_forbidden_and_clearance_phrases_reject(make_job):
+    description_filter = DescriptionFilter(forbidden=["php"])
+    assert description_filter.rejection_reason(make_job(description="Legacy PHP codebase"))[0] == "forbidden"
+    assert description_filter.rejection_reason(make_job(description="Active security clearance required"))[0] == "clearance"
+
+
+def test_required_keywords(make_job):
+    description_filter = DescriptionFilter(required=["python", "go"])
+    assert description_filter.rejection_reason(make_job(description="We write Python")) is None
+    assert description_filter.rejection_reason(make_job(description="We write Java"))[0] == "required"
+
+
+def test_seniority_markers_only_look_at_the_title(make_job):
+    description_filter = DescriptionFilter(seniority_markers=["principal", "director"])
+    job = make_job(title="Backend Engineer", description="Principal Responsibilities: report to the Director")
+    assert description_filter.rejection_reason(job) is None
+    assert description_filter.rejection_reason(make_job(title="Principal Engineer"))[0] == "seniority"
+
+
+def test_years_required_needs_the_word_experience(make_job):
+    description_filter = DescriptionFilter(max_years_required=5)
+    assert description_filter.rejection_reason(make_job(description="In business for 30 years")) is None
+    rejection = description_filter.rejection_reason(make_job(description="10+ years of professional experience"))
+    assert rejection == ("experience", "asks for 10+ years of experience")
+    assert description_filter.rejection_reason(make_job(description="3-5 yrs experience")) is None
+
+
+def test_check_counts_each_job_once(make_job):
+    description_filter = DescriptionFilter(forbidden=["php"])
+    job = make_job(description="PHP")
+    assert not description_filter.check(job)
+    assert not description_filter.check(job)
+    assert (description_filter.checked, description_filter.rejected) == (1, 1)
@@ -0,0 +1,40 @@
+from src.fit_scorer import FitScorer, _flatten, tokenize
+
+
+def test_tokenize_keeps_technical_terms_and_drops_stopwords():
+    assert tokenize("Experience with C++, C# and Node.js for the web") == ["experience", "c++", "c#", "node.js", "web"]
+
+
+def test_flatten_uses_values_and_exam_names_only():
+    section = [{"degree": "BSc Physics", "exam": {"Calculus": "A"}, "skills_acquired": [{"skill_1": "Python"}]}]
+    assert _flatten(section) == ["BSc Physics", "Calculus", "A", "Python"]
+
+
+def test_field_names_are_not_resume_terms(tmp_path):
+    resume = tmp_path / "plain_text_resume.yaml"
+    resume.write_text("experience_details:\n  - position:\n    company:\n    skills_acquired:\n      - skill_1:\n",
+                      encoding="utf-8")
+    parameters = {"fit_scoring": {"enabled": True}, "outputFileDirectory": str(tmp_path),
+                  "uploads": {"plainTextResume": str(resume)}}
+    assert FitScorer.from_parameters(parameters) is None  # nothing to score against
+
+
+def test_scores_rank_matching_jobs_first(make_job):
+    scorer = FitScorer("python django postgresql kubernetes", min_score=0.3)
+    jobs = [make_job("1", title="Sales Manager"), make_job("2", title="Python Django Developer")]
+    kept = scorer.filter(jobs)
+    assert [job.job_id for job in kept] == ["2"]
+    assert jobs[1].fit_score > jobs[0].fit_score == 0.0
+
+
+def test_deprioritise_keeps_poor_fits_last(make_job):
+    scorer = FitScorer("python", min_score=0.5, action="deprioritise")
+    kept = scorer.filter([make_job("1", title="Sales Manager"), make_job("2", title="Python Developer")])
+    assert [job.job_id for job in kept] == ["2", "1"]
+
+
+def test_check_scores_a_description_once(make_job):
+    scorer = FitScorer("python", min_score=0.1)
+    job = make_job(description="Python services")
+    assert scorer.check(job) and scorer.check(job)
+    assert scorer.scored == 1
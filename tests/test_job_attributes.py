@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.job_attributes import (PreferenceFilter, extract_job_attributes, extract_salary, extract_seniority,
+                                extract_work_mode)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$120,000 - $150,000", (120000.0, 150000.0, "USD", "year")),
+    ("USD 90k to 110k", (90000.0, 110000.0, "USD", "year")),
+    ("$120-150k", (120000.0, 150000.0, "USD", "year")),
+    ("Base pay range $95,000.00/yr - $120,000.00/yr", (95000.0, 120000.0, "USD", "yr")),
+    ("between $80,000 and $100,000", (80000.0, 100000.0, "USD", "year")),
+    ("60.000 - 70.000 EUR", (60000.0, 70000.0, "EUR", "year")),
+    ("55k EUR", (55000.0, 55000.0, "EUR", "year")),
+    ("$25 - $30 per hour", (25.0, 30.0, "USD", "hour")),
+    ("Salary is $120,000.", (120000.0, 120000.0, "USD", "year")),
+    ("$50,000 and 401k", (50000.0, 50000.0, "USD", "year")),
+])
+def test_extract_salary(text, expected):
+    assert extract_salary(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "raised $25M from investors", "$2B valuation", "a $40 billion company", "a $2bn round", "a $1.5 fee",
+    "since 2010 - 2015", "no salary here",
+])
+def test_extract_salary_ignores_amounts_that_are_not_pay(text):
+    assert extract_salary(text) is None
+
+
+def test_extract_salary_skips_funding_before_the_range():
+    assert extract_salary("We are a $12M startup. Salary $120,000 - $140,000") == (120000.0, 140000.0, "USD", "year")
+
+
+def test_extract_job_attributes_keeps_the_yearly_range(make_job):
+    job = make_job(description="We are a $12M startup. Salary $120,000 - $140,000")
+    extract_job_attributes(job)
+    assert (job.salary_min, job.salary_max, job.salary_currency) == (120000.0, 140000.0, "USD")
+
+
+@pytest.mark.parametrize("description, location, expected", [
+    ("Fully remote team", "", "Remote"),
+    ("We are remote-first", "", "Remote"),
+    ("This is not a remote role", "", ""),
+    ("non-remote, in office three days", "", "On-Site"),
+    ("Remote work is not possible. On-site in Berlin", "", "On-Site"),
+    ("Hybrid, two days in office", "", "Hybrid"),
+    ("", "Berlin (Remote)", "Remote"),
+])
+def test_extract_work_mode(description, location, expected):
+    assert extract_work_mode(description, location) == expected
+
+
+def test_extract_seniority_reads_the_title_before_the_description():
+    assert extract_seniority("Senior Backend Engineer") == "Senior"
+    assert extract_seniority("Backend Engineer", "You will report to the Director") == ""
+    assert extract_seniority("Backend Engineer", "An entry-level role") == "Entry"
+
+
+def _profile(remote="Yes", in_person="Yes", salary="90000 - 110000"):
+    return SimpleNamespace(
+        work_preferences=SimpleNamespace(remote_work=remote, in_person_work=in_person),
+        salary_expectations=SimpleNamespace(salary_range_usd=salary),
+        legal_authorization=SimpleNamespace(requires_us_sponsorship="No", requires_eu_sponsorship="No"),
+    )
+
+
+def test_preference_filter_rejects_low_pay_and_unwanted_work_mode(make_job):
+    preference_filter = PreferenceFilter(_profile(remote="No"))
+    underpaid = make_job("1", description="On-site. Salary $60,000 - $70,000")
+    remote = make_job("2", description="Fully remote. Salary $100,000 - $120,000")
+    fine = make_job("3", description="On-site. Salary $100,000 - $120,000")
+    for job in (underpaid, remote, fine):
+        extract_job_attributes(job)
+    assert preference_filter.rejection_reason(underpaid)[0] == "salary"
+    assert preference_filter.rejection_reason(remote)[0] == "work_mode"
+    assert preference_filter.check(fine)
+    assert preference_filter.rejected == 0 and preference_filter.checked == 1
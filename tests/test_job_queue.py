@@ -0,0 +1,43 @@
+import threading
+import time
+
+from src.job_queue import JobQueue
+
+
+def test_get_claims_the_highest_priority_first(tmp_path, make_job):
+    job_queue = JobQueue(tmp_path / "queue.db")
+    job_queue.put(make_job("1"), priority=0.5)
+    job_queue.put(make_job("2"), priority=1.5)
+    assert job_queue.get(timeout=0).job_id == "2"
+    assert job_queue.get(timeout=0).job_id == "1"
+    assert job_queue.get(timeout=0) is None
+
+
+def test_a_job_is_queued_once_unless_it_failed(tmp_path, make_job):
+    job_queue = JobQueue(tmp_path / "queue.db")
+    assert job_queue.put(make_job("1"))
+    assert not job_queue.put(make_job("1"))
+    job_queue.mark(job_queue.get(timeout=0), "failed")
+    assert job_queue.put(make_job("1"))
+    assert job_queue.stats() == {"pending": 1}
+
+
+def test_claimed_jobs_go_back_to_pending_when_reopened(tmp_path, make_job):
+    JobQueue(tmp_path / "queue.db").put(make_job("1"))
+    first = JobQueue(tmp_path / "queue.db")
+    assert first.get(timeout=0).job_id == "1"
+    assert JobQueue(tmp_path / "queue.db").stats() == {"pending": 1}
+
+
+def test_close_releases_a_put_blocked_on_a_full_queue(tmp_path, make_job):
+    job_queue = JobQueue(tmp_path / "queue.db", max_pending=1)
+    job_queue.put(make_job("1"))
+    results = []
+    producer = threading.Thread(target=lambda: results.append(job_queue.put(make_job("2"))))
+    producer.start()
+    time.sleep(0.1)
+    job_queue.close()
+    producer.join(timeout=5)
+    assert results == [False]
+    assert job_queue.get(timeout=0).job_id == "1"
+    assert job_queue.get() is None  # closed and drained
@@ -0,0 +1,70 @@
+import pytest
+
+from src.llm_rate_limiter import LLMUnavailableError, RateLimiter
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+def _tokens(limiter):
+    with limiter.state.locked() as state:
+        return state["tokens"]
+
+
+def test_acquire_takes_requests_and_tokens():
+    limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=1000)
+    limiter.acquire(400, requests=2)
+    assert _tokens(limiter) == pytest.approx(600, abs=1)
+    assert limiter._take({"tokens": 900}) > 0  # not enough left: the caller has to wait
+
+
+def test_settle_corrects_the_estimate_with_the_reported_usage():
+    limiter = RateLimiter(tokens_per_minute=1000)
+    limiter.acquire(600)
+    limiter.settle(600, 100)
+    assert _tokens(limiter) == pytest.approx(900, abs=1)
+    limiter.settle(100, 500)
+    assert _tokens(limiter) == pytest.approx(500, abs=1)
+    limiter.settle(100, None)  # no usage reported: the estimate stands
+    assert (limiter.estimated_tokens, limiter.used_tokens) == (700, 600)
+
+
+def test_call_retries_rate_limited_calls(monkeypatch):
+    monkeypatch.setattr("src.llm_rate_limiter.time.sleep", lambda seconds: None)
+    limiter = RateLimiter(max_retries=3)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _RateLimited()
+        return "reply"
+
+    assert limiter.call(flaky) == "reply"
+    assert limiter.retries == 2
+
+
+def test_call_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr("src.llm_rate_limiter.time.sleep", lambda seconds: None)
+    limiter = RateLimiter(max_retries=1)
+
+    def always_limited():
+        raise _RateLimited()
+
+    with pytest.raises(LLMUnavailableError):
+        limiter.call(always_limited)
+
+
+def test_other_errors_are_not_retried():
+    limiter = RateLimiter()
+    with pytest.raises(ValueError):
+        limiter.call(lambda: (_ for _ in ()).throw(ValueError("bad prompt")))
+    assert limiter.retries == 0
+
+
+def test_state_file_is_shared_by_limiters(tmp_path):
+    first = RateLimiter(tokens_per_minute=1000, state_file=tmp_path / "budget.json")
+    second = RateLimiter(tokens_per_minute=1000, state_file=tmp_path / "budget.json")
+    first.acquire(700)
+    assert second._take({"tokens": 700}) > 0
@@ -0,0 +1,41 @@
+import pytest
+
+from src.run_config import ConfigError, RunConfig
+
+
+def _parameters(**overrides):
+    parameters = {
+        "positions": ["Software Engineer"], "locations": ["Berlin, Germany"], "remote": True, "hybrid": True,
+        "experienceLevel": {"entry": True, "mid-senior level": True, "director": False},
+        "jobTypes": {"full-time": True}, "date": {"week": True}, "distance": 25,
+        "outputFileDirectory": "data_folder/output",
+    }
+    parameters.update(overrides)
+    return parameters
+
+
+def test_search_urls_are_encoded_once_with_every_filter():
+    config = RunConfig.compile(_parameters())
+    assert config.searches == (("Software Engineer", "Berlin, Germany"),)
+    assert config.search_url("Software Engineer", "Berlin, Germany", 3) == (
+        "https://www.linkedin.com/jobs/search/?f_WT=2,3&f_E=2,4&f_JT=F&f_TPR=r604800&distance=25"
+        "&keywords=Software%20Engineer&location=Berlin%2C%20Germany&start=50"
+    )
+
+
+def test_compiled_configs_are_reused_for_identical_parameters():
+    assert RunConfig.compile(_parameters()) is RunConfig.compile(_parameters())
+
+
+def test_every_invalid_setting_is_reported():
+    with pytest.raises(ConfigError) as error:
+        RunConfig.compile(_parameters(positions=[], remote="yes", distance=30, jobTypes={"gig": True}))
+    message = str(error.value)
+    for fragment in ("'positions' must list at least one entry", "'remote' must be true or false",
+                     "'distance' must be one of", "unknown 'jobTypes' entries gig"):
+        assert fragment in message
+
+
+def test_unknown_searches_are_still_built():
+    config = RunConfig.compile(_parameters())
+    assert "keywords=Data%20Engineer" in config.search_url("Data Engineer", "Berlin, Germany", 1)